@@ -0,0 +1,23 @@
+"""index evidence.sha256 for content-addressed attachment dedup
+
+Revision ID: 028_evidence_sha256_index
+Revises: 027_parent_evidence_id
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "028_evidence_sha256_index"
+down_revision: Union[str, None] = "027_parent_evidence_id"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_evidence_sha256", "evidence", ["sha256"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_sha256", table_name="evidence")
@@ -0,0 +1,43 @@
+"""partial index on audit_events for tool-run listings
+
+Revision ID: 029_audit_tool_runs_partial_index
+Revises: 028_evidence_sha256_index
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "029_audit_tool_runs_partial_index"
+down_revision: Union[str, None] = "028_evidence_sha256_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with TOOL_RUN_ACTIONS in app/api/routes/projects.py.
+TOOL_RUN_ACTIONS = (
+    "nmap_import_started",
+    "nmap_import_completed",
+    "gowitness_import_started",
+    "gowitness_import_completed",
+    "text_import_started",
+    "text_import_completed",
+    "masscan_import_started",
+    "masscan_import_completed",
+)
+
+
+def upgrade() -> None:
+    actions = ", ".join(f"'{a}'" for a in TOOL_RUN_ACTIONS)
+    op.execute(
+        sa.text(
+            "CREATE INDEX ix_audit_events_tool_runs "
+            "ON audit_events (project_id, created_at DESC) "
+            f"WHERE action_type IN ({actions})"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_events_tool_runs", table_name="audit_events")
@@ -0,0 +1,34 @@
+"""ordering indexes for project and subnet listings
+
+Revision ID: 030_list_ordering_indexes
+Revises: 029_audit_tool_runs_partial_index
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "030_list_ordering_indexes"
+down_revision: Union[str, None] = "029_audit_tool_runs_partial_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_projects orders by created_at DESC; a matching descending index
+    # lets the planner stream rows in order instead of seq-scan + sort.
+    op.execute(
+        sa.text("CREATE INDEX ix_projects_created_at_desc ON projects (created_at DESC)")
+    )
+    # list_subnets filters by project_id; created_at covers the
+    # last_seen_desc sort mode within a project.
+    op.create_index(
+        "ix_subnets_project_created", "subnets", ["project_id", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_subnets_project_created", table_name="subnets")
+    op.drop_index("ix_projects_created_at_desc", table_name="projects")
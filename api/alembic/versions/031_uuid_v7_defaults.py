@@ -0,0 +1,73 @@
+"""server-side UUIDv7 generation for primary keys
+
+Revision ID: 031_uuid_v7_defaults
+Revises: 030_list_ordering_indexes
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "031_uuid_v7_defaults"
+down_revision: Union[str, None] = "030_list_ordering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table with a uuid primary key; keep in sync with models.py.
+TABLES = (
+    "users",
+    "projects",
+    "subnets",
+    "hosts",
+    "ports",
+    "applications",
+    "vulnerability_subnet_associations",
+    "vulnerability_attachments",
+    "vulnerability_definitions",
+    "vulnerability_instances",
+    "evidence",
+    "notes",
+    "todos",
+    "saved_reports",
+    "tags",
+    "item_tags",
+    "locks",
+    "audit_events",
+    "import_export_jobs",
+    "sessions",
+    "jobs",
+)
+
+# Overlay a unix-ms timestamp on the first 48 bits of a random uuid and set
+# the version nibble to 7; the variant bits from gen_random_uuid() are
+# already correct. Time-ordered ids keep inserts at the right edge of the
+# primary-key B-tree instead of splitting pages all over it.
+GEN_UUID_V7 = """
+CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid
+AS $$
+DECLARE
+  unix_ts_ms bytea;
+  uuid_bytes bytea;
+BEGIN
+  unix_ts_ms = substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) from 3);
+  uuid_bytes = uuid_send(gen_random_uuid());
+  uuid_bytes = overlay(uuid_bytes placing unix_ts_ms from 1 for 6);
+  uuid_bytes = set_byte(uuid_bytes, 6, (b'0111' || get_byte(uuid_bytes, 6)::bit(4))::bit(8)::int);
+  RETURN encode(uuid_bytes, 'hex')::uuid;
+END
+$$ LANGUAGE plpgsql VOLATILE;
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.text(GEN_UUID_V7))
+    for table in TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_uuid_v7()"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS gen_uuid_v7()"))
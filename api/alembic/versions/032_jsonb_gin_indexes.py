@@ -0,0 +1,40 @@
+"""GIN jsonb_path_ops indexes on queried JSONB columns
+
+Revision ID: 032_jsonb_gin_indexes
+Revises: 031_uuid_v7_defaults
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "032_jsonb_gin_indexes"
+down_revision: Union[str, None] = "031_uuid_v7_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column); jsonb_path_ops is roughly half the size of
+# the default jsonb_ops class and faster for @> containment, which is the
+# only operator these columns are filtered with.
+INDEXES = (
+    ("idx_projects_scope_policy_gin", "projects", "scope_policy"),
+    ("idx_applications_metadata_gin", "applications", "metadata"),
+    ("idx_audit_before_json_gin", "audit_events", "before_json"),
+    ("idx_audit_after_json_gin", "audit_events", "after_json"),
+    ("idx_jobs_target_ref_gin", "jobs", "target_ref"),
+    ("idx_jobs_parameters_gin", "jobs", "parameters"),
+)
+
+
+def upgrade() -> None:
+    for name, table, column in INDEXES:
+        op.execute(
+            sa.text(f"CREATE INDEX {name} ON {table} USING GIN ({column} jsonb_path_ops)")
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,33 @@
+"""GIN indexes on array tag/CVE/reference columns
+
+Revision ID: 033_array_gin_indexes
+Revises: 032_jsonb_gin_indexes
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "033_array_gin_indexes"
+down_revision: Union[str, None] = "032_jsonb_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("idx_hosts_tags_gin", "hosts", "tags"),
+    ("idx_vuln_defs_cve_ids_gin", "vulnerability_definitions", "cve_ids"),
+    ("idx_vuln_defs_references_gin", "vulnerability_definitions", '"references"'),
+    ("idx_jobs_raw_artifact_paths_gin", "jobs", "raw_artifact_paths"),
+)
+
+
+def upgrade() -> None:
+    for name, table, column in INDEXES:
+        op.execute(sa.text(f"CREATE INDEX {name} ON {table} USING GIN ({column})"))
+
+
+def downgrade() -> None:
+    for name, table, _column in INDEXES:
+        op.drop_index(name, table_name=table)
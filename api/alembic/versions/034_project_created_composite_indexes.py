@@ -0,0 +1,74 @@
+"""composite project/created_at indexes for hot list queries
+
+Revision ID: 034_project_created_composite_indexes
+Revises: 033_array_gin_indexes
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "034_project_created_composite_indexes"
+down_revision: Union[str, None] = "033_array_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # These tables are listed as "by project, newest first" (jobs and vuln
+    # instances additionally filter on status); a composite index streams
+    # rows in order instead of index scan + heap sort. evidence also carries
+    # the file-listing projection via INCLUDE for index-only scans.
+    op.execute(
+        sa.text(
+            "CREATE INDEX idx_evidence_project_created ON evidence "
+            "(project_id, created_at DESC) INCLUDE (filename, mime, size)"
+        )
+    )
+    op.execute(
+        sa.text("CREATE INDEX idx_notes_project_created ON notes (project_id, created_at DESC)")
+    )
+    op.execute(
+        sa.text(
+            "CREATE INDEX idx_audit_project_created ON audit_events "
+            "(project_id, created_at DESC)"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE INDEX idx_vuln_instances_project_status_created ON "
+            "vulnerability_instances (project_id, status, created_at DESC)"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE INDEX idx_jobs_project_status_created ON jobs "
+            "(project_id, status, created_at DESC)"
+        )
+    )
+    # The composites are left-prefixed on project_id, so the standalone
+    # project_id indexes are redundant write overhead now.
+    op.drop_index("ix_evidence_project_id", table_name="evidence")
+    op.drop_index("ix_notes_project_id", table_name="notes")
+    op.drop_index("ix_audit_events_project_id", table_name="audit_events")
+    op.drop_index("ix_vulnerability_instances_project_id", table_name="vulnerability_instances")
+    op.drop_index("ix_jobs_project_id", table_name="jobs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_jobs_project_id", "jobs", ["project_id"])
+    op.create_index(
+        "ix_vulnerability_instances_project_id", "vulnerability_instances", ["project_id"]
+    )
+    op.create_index("ix_audit_events_project_id", "audit_events", ["project_id"])
+    op.create_index("ix_notes_project_id", "notes", ["project_id"])
+    op.create_index("ix_evidence_project_id", "evidence", ["project_id"])
+    op.drop_index("idx_jobs_project_status_created", table_name="jobs")
+    op.drop_index(
+        "idx_vuln_instances_project_status_created", table_name="vulnerability_instances"
+    )
+    op.drop_index("idx_audit_project_created", table_name="audit_events")
+    op.drop_index("idx_notes_project_created", table_name="notes")
+    op.drop_index("idx_evidence_project_created", table_name="evidence")
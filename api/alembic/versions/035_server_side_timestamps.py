@@ -0,0 +1,91 @@
+"""server-side now() defaults and updated_at trigger
+
+Revision ID: 035_server_side_timestamps
+Revises: 034_project_created_composite_indexes
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "035_server_side_timestamps"
+down_revision: Union[str, None] = "034_project_created_composite_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every timestamp column that previously used a Python-side
+# default=datetime.utcnow; the server clock becomes the single source of
+# truth and inserts stop shipping a datetime parameter per row.
+DEFAULT_COLUMNS = (
+    ("users", "created_at"),
+    ("projects", "created_at"),
+    ("subnets", "created_at"),
+    ("hosts", "created_at"),
+    ("hosts", "updated_at"),
+    ("ports", "created_at"),
+    ("ports", "updated_at"),
+    ("applications", "created_at"),
+    ("vulnerability_subnet_associations", "created_at"),
+    ("vulnerability_attachments", "created_at"),
+    ("vulnerability_definitions", "created_at"),
+    ("vulnerability_definitions", "updated_at"),
+    ("vulnerability_instances", "created_at"),
+    ("vulnerability_instances", "updated_at"),
+    ("evidence", "created_at"),
+    ("notes", "created_at"),
+    ("notes", "updated_at"),
+    ("todos", "created_at"),
+    ("todos", "updated_at"),
+    ("saved_reports", "created_at"),
+    ("locks", "locked_at"),
+    ("audit_events", "created_at"),
+    ("import_export_jobs", "created_at"),
+    ("sessions", "last_activity"),
+    ("sessions", "created_at"),
+    ("jobs", "created_at"),
+)
+
+# Tables whose updated_at was maintained by the Python-side onupdate; a
+# BEFORE UPDATE trigger fills it server-side now.
+TRIGGER_TABLES = (
+    "hosts",
+    "ports",
+    "vulnerability_definitions",
+    "vulnerability_instances",
+    "notes",
+    "todos",
+    "saved_reports",
+)
+
+SET_UPDATED_AT = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+AS $$
+BEGIN
+  NEW.updated_at = now();
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    for table, column in DEFAULT_COLUMNS:
+        op.execute(sa.text(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now()"))
+    op.execute(sa.text(SET_UPDATED_AT))
+    for table in TRIGGER_TABLES:
+        op.execute(
+            sa.text(
+                f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+                "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+            )
+        )
+
+
+def downgrade() -> None:
+    for table in TRIGGER_TABLES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS set_updated_at()"))
+    for table, column in DEFAULT_COLUMNS:
+        op.execute(sa.text(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT"))
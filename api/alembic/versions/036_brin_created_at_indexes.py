@@ -0,0 +1,42 @@
+"""BRIN indexes on created_at for append-only tables
+
+Revision ID: 036_brin_created_at_indexes
+Revises: 035_server_side_timestamps
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "036_brin_created_at_indexes"
+down_revision: Union[str, None] = "035_server_side_timestamps"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Append-only tables whose rows land in created_at order (UUIDv7 primary
+# keys keep the heap clustered that way). BRIN stores one summary per range
+# of pages, so it stays a tiny fraction of a B-tree's size, costs almost
+# nothing to maintain on insert, and serves time-range scans well.
+INDEXES = (
+    ("idx_audit_events_created_brin", "audit_events"),
+    ("idx_sessions_created_brin", "sessions"),
+    ("idx_jobs_created_brin", "jobs"),
+    ("idx_evidence_created_brin", "evidence"),
+)
+
+
+def upgrade() -> None:
+    for name, table in INDEXES:
+        op.execute(
+            sa.text(
+                f"CREATE INDEX {name} ON {table} USING BRIN (created_at) "
+                "WITH (pages_per_range = 32)"
+            )
+        )
+
+
+def downgrade() -> None:
+    for name, table in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,38 @@
+"""unique record index on locks
+
+Revision ID: 037_locks_record_unique_index
+Revises: 036_brin_created_at_indexes
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "037_locks_record_unique_index"
+down_revision: Union[str, None] = "036_brin_created_at_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A partial predicate like WHERE expires_at > now() is rejected by
+    # Postgres (now() is not IMMUTABLE), so the index covers all rows and
+    # the service layer purges expired ones. Clear stale rows first; keep
+    # the newest per record in case two rows exist for the same target.
+    op.execute(sa.text("DELETE FROM locks WHERE expires_at <= now()"))
+    op.execute(
+        sa.text(
+            "DELETE FROM locks a USING locks b "
+            "WHERE a.record_type = b.record_type AND a.record_id = b.record_id "
+            "AND a.expires_at < b.expires_at"
+        )
+    )
+    op.create_index(
+        "idx_locks_record", "locks", ["record_type", "record_id"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_locks_record", table_name="locks")
@@ -0,0 +1,143 @@
+"""range-partition audit_events by created_at
+
+Revision ID: 038_partition_audit_events
+Revises: 037_locks_record_unique_index
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "038_partition_audit_events"
+down_revision: Union[str, None] = "037_locks_record_unique_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# audit_events grows without bound and is only ever filtered by recency, so
+# monthly range partitions let queries prune old months, keep autovacuum
+# per-partition, and make retention a DROP TABLE instead of a bulk DELETE.
+# The partition key must be part of the primary key, hence (id, created_at);
+# nothing references audit_events by id, so the composite key is free.
+PARTITIONED_TABLE = """
+CREATE TABLE audit_events (
+    id uuid NOT NULL DEFAULT gen_uuid_v7(),
+    project_id uuid REFERENCES projects(id) ON DELETE CASCADE,
+    user_id uuid REFERENCES users(id) ON DELETE SET NULL,
+    action_type varchar(64) NOT NULL,
+    record_type varchar(64),
+    record_id uuid,
+    before_json jsonb,
+    after_json jsonb,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    ip_address varchar(45),
+    user_agent text,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at)
+"""
+
+# Creates any missing monthly partitions from `from_month` through
+# `months_ahead` months past the current one. Re-run periodically (the
+# app lifespan schedules it daily); the DEFAULT partition catches rows
+# for months nobody created yet, so inserts never fail. Each partition
+# is built standalone, any rows for its month are pulled out of the
+# DEFAULT partition, and only then is it attached — ATTACH PARTITION
+# errors if the default still holds rows inside the new range.
+ENSURE_PARTITIONS = """
+CREATE OR REPLACE FUNCTION ensure_audit_events_partitions(
+    from_month date DEFAULT date_trunc('month', now())::date,
+    months_ahead int DEFAULT 3
+) RETURNS void
+AS $$
+DECLARE
+  m date := date_trunc('month', from_month)::date;
+  last_month date := (date_trunc('month', now()) + (months_ahead || ' months')::interval)::date;
+  next_m date;
+  part_name text;
+BEGIN
+  WHILE m <= last_month LOOP
+    part_name := 'audit_events_' || to_char(m, 'YYYYMM');
+    next_m := (m + interval '1 month')::date;
+    IF to_regclass(part_name) IS NULL THEN
+      EXECUTE format('CREATE TABLE %I (LIKE audit_events INCLUDING DEFAULTS)', part_name);
+      EXECUTE format(
+        'WITH moved AS (DELETE FROM audit_events_default '
+        'WHERE created_at >= %L AND created_at < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        m, next_m, part_name
+      );
+      EXECUTE format(
+        'ALTER TABLE audit_events ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        part_name, m, next_m
+      );
+    END IF;
+    m := next_m;
+  END LOOP;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+# Indexes are declared on the parent and propagate to every partition.
+INDEXES = (
+    "CREATE INDEX ix_audit_events_user_id ON audit_events (user_id)",
+    "CREATE INDEX idx_audit_before_json_gin ON audit_events USING GIN (before_json jsonb_path_ops)",
+    "CREATE INDEX idx_audit_after_json_gin ON audit_events USING GIN (after_json jsonb_path_ops)",
+    "CREATE INDEX idx_audit_project_created ON audit_events (project_id, created_at DESC)",
+    "CREATE INDEX idx_audit_events_created_brin ON audit_events USING BRIN (created_at) WITH (pages_per_range = 32)",
+    # Keep the action list in sync with TOOL_RUN_ACTIONS in
+    # app/api/routes/projects.py (originally migration 029).
+    "CREATE INDEX ix_audit_events_tool_runs ON audit_events (project_id, created_at DESC) "
+    "WHERE action_type IN ('nmap_import_started', 'nmap_import_completed', "
+    "'gowitness_import_started', 'gowitness_import_completed', "
+    "'text_import_started', 'text_import_completed', "
+    "'masscan_import_started', 'masscan_import_completed')",
+)
+
+
+def upgrade() -> None:
+    op.execute(sa.text("ALTER TABLE audit_events RENAME TO audit_events_legacy"))
+    op.execute(sa.text(PARTITIONED_TABLE))
+    op.execute(sa.text("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT"))
+    op.execute(sa.text(ENSURE_PARTITIONS))
+    # Cover every month of existing data plus a year of headroom, then move
+    # the rows over; the tuple router places each in its month partition.
+    op.execute(
+        sa.text(
+            "SELECT ensure_audit_events_partitions("
+            "(SELECT coalesce(date_trunc('month', min(created_at))::date, "
+            "date_trunc('month', now())::date) FROM audit_events_legacy), 12)"
+        )
+    )
+    op.execute(sa.text("INSERT INTO audit_events SELECT * FROM audit_events_legacy"))
+    op.execute(sa.text("DROP TABLE audit_events_legacy"))
+    for ddl in INDEXES:
+        op.execute(sa.text(ddl))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("ALTER TABLE audit_events RENAME TO audit_events_partitioned"))
+    op.execute(
+        sa.text(
+            """
+            CREATE TABLE audit_events (
+                id uuid NOT NULL DEFAULT gen_uuid_v7() PRIMARY KEY,
+                project_id uuid REFERENCES projects(id) ON DELETE CASCADE,
+                user_id uuid REFERENCES users(id) ON DELETE SET NULL,
+                action_type varchar(64) NOT NULL,
+                record_type varchar(64),
+                record_id uuid,
+                before_json jsonb,
+                after_json jsonb,
+                created_at timestamptz NOT NULL DEFAULT now(),
+                ip_address varchar(45),
+                user_agent text
+            )
+            """
+        )
+    )
+    op.execute(sa.text("INSERT INTO audit_events SELECT * FROM audit_events_partitioned"))
+    op.execute(sa.text("DROP TABLE audit_events_partitioned"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS ensure_audit_events_partitions(date, int)"))
+    for ddl in INDEXES:
+        op.execute(sa.text(ddl))
@@ -0,0 +1,79 @@
+"""denormalize uploader username onto evidence
+
+Revision ID: 039_evidence_uploader_denorm
+Revises: 038_partition_audit_events
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "039_evidence_uploader_denorm"
+down_revision: Union[str, None] = "038_partition_audit_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Fills the denormalized column on insert (and if the uploader fk is ever
+# rewritten) so application code never has to join users for display.
+SET_UPLOADER = """
+CREATE OR REPLACE FUNCTION set_evidence_uploaded_by() RETURNS trigger
+AS $$
+BEGIN
+  IF NEW.created_by_user_id IS NOT NULL THEN
+    SELECT username INTO NEW.uploaded_by_username
+    FROM users WHERE id = NEW.created_by_user_id;
+  ELSE
+    NEW.uploaded_by_username = NULL;
+  END IF;
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+# Usernames rarely change; when one does, sweep the denormalized copies.
+SYNC_ON_RENAME = """
+CREATE OR REPLACE FUNCTION sync_evidence_uploader_username() RETURNS trigger
+AS $$
+BEGIN
+  UPDATE evidence SET uploaded_by_username = NEW.username
+  WHERE created_by_user_id = NEW.id;
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.add_column("evidence", sa.Column("uploaded_by_username", sa.String(255), nullable=True))
+    op.execute(
+        sa.text(
+            "UPDATE evidence e SET uploaded_by_username = u.username "
+            "FROM users u WHERE e.created_by_user_id = u.id"
+        )
+    )
+    op.execute(sa.text(SET_UPLOADER))
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER trg_evidence_uploaded_by "
+            "BEFORE INSERT OR UPDATE OF created_by_user_id ON evidence "
+            "FOR EACH ROW EXECUTE FUNCTION set_evidence_uploaded_by()"
+        )
+    )
+    op.execute(sa.text(SYNC_ON_RENAME))
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER trg_users_sync_evidence_username "
+            "AFTER UPDATE OF username ON users "
+            "FOR EACH ROW EXECUTE FUNCTION sync_evidence_uploader_username()"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP TRIGGER IF EXISTS trg_users_sync_evidence_username ON users"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS sync_evidence_uploader_username()"))
+    op.execute(sa.text("DROP TRIGGER IF EXISTS trg_evidence_uploaded_by ON evidence"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS set_evidence_uploaded_by()"))
+    op.drop_column("evidence", "uploaded_by_username")
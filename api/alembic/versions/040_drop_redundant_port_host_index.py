@@ -0,0 +1,25 @@
+"""drop standalone ports.host_id index
+
+Revision ID: 040_drop_redundant_port_host_index
+Revises: 039_evidence_uploader_denorm
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "040_drop_redundant_port_host_index"
+down_revision: Union[str, None] = "039_evidence_uploader_denorm"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # uq_host_protocol_number is backed by a unique index left-prefixed on
+    # host_id, so the standalone index only adds write overhead.
+    op.drop_index("ix_ports_host_id", table_name="ports")
+
+
+def downgrade() -> None:
+    op.create_index("ix_ports_host_id", "ports", ["host_id"])
@@ -0,0 +1,38 @@
+"""narrow countdown_red_days_default to smallint
+
+Revision ID: 041_smallint_countdown_days
+Revises: 040_drop_redundant_port_host_index
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "041_smallint_countdown_days"
+down_revision: Union[str, None] = "040_drop_redundant_port_host_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The API caps this at 365, well inside smallint range. ports.number is
+    # deliberately left as integer: 1-65535 overflows signed smallint.
+    op.alter_column(
+        "projects",
+        "countdown_red_days_default",
+        type_=sa.SmallInteger(),
+        existing_type=sa.Integer(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "projects",
+        "countdown_red_days_default",
+        type_=sa.Integer(),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+    )
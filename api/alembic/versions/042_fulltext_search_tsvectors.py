@@ -0,0 +1,49 @@
+"""generated tsvector columns + GIN indexes for full-text search
+
+Revision ID: 042_fulltext_search_tsvectors
+Revises: 041_smallint_countdown_days
+Create Date: 2025-03-05
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "042_fulltext_search_tsvectors"
+down_revision: Union[str, None] = "041_smallint_countdown_days"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored generated columns keep the tsvector in sync server-side; the GIN
+    # indexes make `search_tsv @@ plainto_tsquery(...)` sub-linear instead of
+    # an ILIKE '%term%' sequential scan.
+    op.execute(
+        sa.text(
+            "ALTER TABLE vulnerability_definitions ADD COLUMN search_tsv tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('english', "
+            "coalesce(title, '') || ' ' || coalesce(description_md, ''))) STORED"
+        )
+    )
+    op.execute(
+        sa.text(
+            "ALTER TABLE notes ADD COLUMN search_tsv tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('english', coalesce(body_md, ''))) STORED"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE INDEX idx_vuln_defs_search_tsv_gin ON vulnerability_definitions "
+            "USING GIN (search_tsv)"
+        )
+    )
+    op.execute(sa.text("CREATE INDEX idx_notes_search_tsv_gin ON notes USING GIN (search_tsv)"))
+
+
+def downgrade() -> None:
+    op.drop_index("idx_notes_search_tsv_gin", table_name="notes")
+    op.drop_index("idx_vuln_defs_search_tsv_gin", table_name="vulnerability_definitions")
+    op.drop_column("notes", "search_tsv")
+    op.drop_column("vulnerability_definitions", "search_tsv")
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.core.admin_deps import require_admin
 from app.db.session import get_db
@@ -32,6 +32,7 @@ def list_active_locks(
         .options(
             joinedload(Lock.locked_by),
             joinedload(Lock.project),
+            raiseload("*"),
         )
         .filter(Lock.expires_at > now)
         .order_by(Lock.project_id, Lock.locked_at)
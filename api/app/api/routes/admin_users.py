@@ -11,6 +11,7 @@ from app.db.session import get_db
 from app.models.models import User
 from app.schemas.admin_user import AdminUserCreate, AdminUserRead, AdminUserResetPassword, AdminUserUpdate
 from app.services.audit import log_audit
+from app.services.user_cache import invalidate_user
 
 router = APIRouter()
 
@@ -122,6 +123,7 @@ def update_user(
     )
     db.commit()
     db.refresh(user)
+    invalidate_user(user.id)
     return AdminUserRead(
         id=user.id,
         username=user.username,
@@ -162,6 +164,7 @@ def disable_user(
         ip_address=_get_client_ip(request),
     )
     db.commit()
+    invalidate_user(user.id)
     return {"ok": True}
 
 
@@ -189,6 +192,7 @@ def enable_user(
         ip_address=_get_client_ip(request),
     )
     db.commit()
+    invalidate_user(user.id)
     return {"ok": True}
 
 
@@ -216,6 +220,7 @@ def reset_password(
         ip_address=_get_client_ip(request),
     )
     db.commit()
+    invalidate_user(user.id)
     return {"ok": True}
 
 
@@ -249,4 +254,5 @@ def delete_user(
     )
     db.delete(user)
     db.commit()
+    invalidate_user(user_id)
     return None
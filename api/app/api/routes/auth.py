@@ -12,6 +12,7 @@ from app.core.security import (
 from app.db.session import get_db
 from app.models.models import User, Session as SessionModel
 from app.schemas.auth import ChangePasswordRequest, LoginRequest, LoginResponse, UserRead
+from app.services.user_cache import invalidate_user
 
 router = APIRouter()
 
@@ -136,6 +137,7 @@ def change_password(
     current_user.must_change_password = False
     db.commit()
     db.refresh(current_user)
+    invalidate_user(current_user.id)
     return {"ok": True}
 
 
@@ -1,5 +1,8 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from fastapi import status
@@ -15,6 +18,25 @@ from app.services.sort import apply_host_order, SORT_MODES, DEFAULT_SORT
 
 router = APIRouter()
 
+# One Rust-side pass for the whole list instead of per-row model_validate.
+_HOST_LIST_ADAPTER = TypeAdapter(list[HostRead])
+
+# Column-only projection for the list endpoint: plain rows skip ORM identity
+# tracking and per-object instance state the read path never uses.
+_HOST_LIST_COLUMNS = (
+    Host.id,
+    Host.project_id,
+    Host.subnet_id,
+    Host.ip,
+    Host.dns_name,
+    Host.tags,
+    Host.status,
+    Host.whois_data,
+    Host.in_scope,
+    Host.created_at,
+    Host.updated_at,
+)
+
 
 def _resolve_sort_mode(db: Session, project_id: UUID | None, sort_mode: str | None) -> str:
     if sort_mode and sort_mode in SORT_MODES:
@@ -34,14 +56,16 @@ def list_hosts(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(Host)
+    stmt = select(*_HOST_LIST_COLUMNS)
     if project_id is not None:
-        q = q.filter(Host.project_id == project_id)
+        stmt = stmt.where(Host.project_id == project_id)
     if subnet_id is not None:
-        q = q.filter(Host.subnet_id == subnet_id)
+        stmt = stmt.where(Host.subnet_id == subnet_id)
     mode = _resolve_sort_mode(db, project_id, sort_mode)
-    q = apply_host_order(q, mode, join_subnet=(project_id is not None))
-    return q.all()
+    stmt = apply_host_order(stmt, mode, join_subnet=(project_id is not None))
+    rows = db.execute(stmt).mappings().all()
+    models = _HOST_LIST_ADAPTER.validate_python(rows)
+    return Response(content=_HOST_LIST_ADAPTER.dump_json(models), media_type="application/json")
 
 
 @router.post("", response_model=HostRead, status_code=201)
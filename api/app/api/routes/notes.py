@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user
@@ -88,12 +89,15 @@ def list_notes(
     host_id: UUID | None = Query(None),
     port_id: UUID | None = Query(None),
     evidence_id: UUID | None = Query(None),
+    search: str | None = Query(None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     q = db.query(Note)
     if project_id is not None:
         q = q.filter(Note.project_id == project_id)
+    if search:
+        q = q.filter(Note.search_tsv.op("@@")(func.plainto_tsquery("english", search)))
     if subnet_id is not None:
         q = q.filter(Note.subnet_id == subnet_id)
     if host_id is not None:
@@ -1,11 +1,11 @@
 from uuid import UUID
 import os
-import uuid as uuid_mod
-import shutil
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile
+from pydantic import TypeAdapter
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
 from fastapi import status
 
@@ -15,15 +15,76 @@ from app.db.session import get_db
 from app.models.models import Evidence, Port, Host, Project, User
 from app.schemas.port import PortCreate, PortUpdate, PortRead, PortReadWithAttachments, PortAttachmentSummary
 from app.schemas.evidence import EvidenceRead, EvidenceNotesUpdate
+from app.services.blob_store import ext_for, remove_blob_if_unused_background, store_blob
 from app.services.lock import require_lock
-from app.services.audit import log_audit
-from app.services.sort import apply_port_order, SORT_MODES, DEFAULT_SORT
+from app.services.audit import log_audit_background
+from app.services.sort import apply_port_order, SortMode, SORT_MODES, DEFAULT_SORT
 
-router = APIRouter()
+# orjson handles UUID/datetime natively and is far cheaper than stdlib json
+# for the large port lists these endpoints return.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# One Rust-side pass per list instead of per-row model_validate loops.
+_PORT_LIST_ADAPTER = TypeAdapter(list[PortRead])
+_EVIDENCE_LIST_ADAPTER = TypeAdapter(list[EvidenceRead])
+
+# Column-only projection for the list endpoint: plain rows skip ORM identity
+# tracking and per-object instance state the read path never uses.
+_PORT_LIST_COLUMNS = (
+    Port.id,
+    Port.host_id,
+    Port.protocol,
+    Port.number,
+    Port.state,
+    Port.service_name,
+    Port.service_version,
+    Port.banner,
+    Port.description_md,
+    Port.evidence_md,
+    Port.discovered_by,
+    Port.scanned_at,
+    Port.scan_metadata,
+    Port.created_at,
+    Port.updated_at,
+)
+
+
+# Pre-serialized list_ports responses keyed by (host_id, sort_mode, version)
+# where version is (max(updated_at), count) for the host. Any port change
+# bumps the version, so stale entries are simply never hit again; the dict is
+# bounded by dropping its oldest half when full.
+_port_list_cache: dict[tuple, bytes] = {}
+_PORT_LIST_CACHE_MAX = 1024
+
+
+def _port_list_cache_get(key: tuple) -> bytes | None:
+    return _port_list_cache.get(key)
+
+
+def _port_list_cache_put(key: tuple, payload: bytes) -> None:
+    if len(_port_list_cache) >= _PORT_LIST_CACHE_MAX:
+        for old_key in list(_port_list_cache)[: _PORT_LIST_CACHE_MAX // 2]:
+            _port_list_cache.pop(old_key, None)
+    _port_list_cache[key] = payload
+
+
+def _fetch_port_and_project(db: Session, port_id: UUID) -> tuple[Port, UUID]:
+    """Load a port and its project_id in one query.
+
+    The mutating endpoints all need the project_id for require_lock; joining
+    Host here avoids the lazy port.host load (a second SELECT per request).
+    Raises 404 if the port does not exist.
+    """
+    row = db.execute(
+        select(Port, Host.project_id).join(Host).where(Port.id == port_id)
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Port not found")
+    return row[0], row[1]
 
 
 def _resolve_port_sort_mode(db: Session, project_id: UUID | None, sort_mode: str | None) -> str:
-    if sort_mode and sort_mode in SORT_MODES:
+    if sort_mode:
         return sort_mode
     if project_id:
         proj = db.query(Project).filter(Project.id == project_id).first()
@@ -36,21 +97,38 @@ def _resolve_port_sort_mode(db: Session, project_id: UUID | None, sort_mode: str
 def list_ports(
     host_id: UUID | None = Query(None),
     project_id: UUID | None = Query(None),
-    sort_mode: str | None = Query(None),
+    sort_mode: SortMode | None = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(Port)
+    stmt = select(*_PORT_LIST_COLUMNS)
     if project_id is not None:
-        q = q.join(Host).filter(Host.project_id == project_id)
+        stmt = stmt.join(Host, Port.host_id == Host.id).where(Host.project_id == project_id)
         mode = _resolve_port_sort_mode(db, project_id, sort_mode)
     elif host_id is not None:
-        q = q.filter(Port.host_id == host_id)
-        mode = sort_mode if sort_mode in SORT_MODES else DEFAULT_SORT
+        stmt = stmt.where(Port.host_id == host_id)
+        mode = sort_mode or DEFAULT_SORT
+        # Per-host lists are polled repeatedly by the dashboard; a one-row
+        # version lookup lets us reuse the serialized response until a port
+        # on the host actually changes.
+        version = db.execute(
+            select(func.max(Port.updated_at), func.count(Port.id)).where(
+                Port.host_id == host_id
+            )
+        ).one()
+        key = (host_id, mode, version[0], version[1])
+        cached = _port_list_cache_get(key)
+        if cached is None:
+            rows = db.execute(apply_port_order(stmt, mode)).mappings().all()
+            models = _PORT_LIST_ADAPTER.validate_python(rows)
+            cached = _PORT_LIST_ADAPTER.dump_json(models)
+            _port_list_cache_put(key, cached)
+        return Response(content=cached, media_type="application/json")
     else:
-        mode = sort_mode if sort_mode in SORT_MODES else DEFAULT_SORT
-    q = apply_port_order(q, mode)
-    return q.all()
+        mode = sort_mode or DEFAULT_SORT
+    rows = db.execute(apply_port_order(stmt, mode)).mappings().all()
+    models = _PORT_LIST_ADAPTER.validate_python(rows)
+    return Response(content=_PORT_LIST_ADAPTER.dump_json(models), media_type="application/json")
 
 
 @router.post("", response_model=PortRead, status_code=201)
@@ -105,7 +183,6 @@ def get_port(
         raise HTTPException(status_code=404, detail="Port not found")
     atts = (
         db.query(Evidence)
-        .options(joinedload(Evidence.uploaded_by))
         .filter(Evidence.port_id == port_id)
         .order_by(Evidence.created_at.asc())
         .all()
@@ -121,7 +198,7 @@ def get_port(
             is_pasted=bool(a.is_pasted),
             source=a.source,
             notes_md=a.notes_md,
-            uploaded_by_username=a.uploaded_by.username if a.uploaded_by else None,
+            uploaded_by_username=a.uploaded_by_username,
             created_at=a.created_at,
             imported_at=a.imported_at,
             source_file=a.source_file,
@@ -142,11 +219,9 @@ def update_port(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    port = db.query(Port).filter(Port.id == port_id).first()
-    if not port:
-        raise HTTPException(status_code=404, detail="Port not found")
+    port, project_id = _fetch_port_and_project(db, port_id)
     try:
-        require_lock(db, port.host.project_id, "port", port_id, current_user)
+        require_lock(db, project_id, "port", port_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     data = body.model_dump(exclude_unset=True)
@@ -163,11 +238,9 @@ def delete_port(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    port = db.query(Port).filter(Port.id == port_id).first()
-    if not port:
-        raise HTTPException(status_code=404, detail="Port not found")
+    port, project_id = _fetch_port_and_project(db, port_id)
     try:
-        require_lock(db, port.host.project_id, "port", port_id, current_user)
+        require_lock(db, project_id, "port", port_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     db.delete(port)
@@ -186,12 +259,11 @@ def list_port_attachments(
         raise HTTPException(status_code=404, detail="Port not found")
     atts = (
         db.query(Evidence)
-        .options(joinedload(Evidence.uploaded_by))
         .filter(Evidence.port_id == port_id)
         .order_by(Evidence.created_at.asc())
         .all()
     )
-    return [
+    models = [
         EvidenceRead(
             id=a.id,
             port_id=a.port_id,
@@ -203,7 +275,7 @@ def list_port_attachments(
             is_pasted=bool(a.is_pasted),
             source=a.source,
             notes_md=a.notes_md,
-            uploaded_by_username=a.uploaded_by.username if a.uploaded_by else None,
+            uploaded_by_username=a.uploaded_by_username,
             created_at=a.created_at,
             imported_at=a.imported_at,
             source_file=a.source_file,
@@ -211,53 +283,50 @@ def list_port_attachments(
         )
         for a in atts
     ]
+    return Response(
+        content=_EVIDENCE_LIST_ADAPTER.dump_json(models), media_type="application/json"
+    )
 
 
 @router.post("/{port_id}/attachments", response_model=EvidenceRead, status_code=201)
 def upload_port_attachment(
     port_id: UUID,
+    background: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    port = db.query(Port).filter(Port.id == port_id).first()
-    if not port:
-        raise HTTPException(status_code=404, detail="Port not found")
+    port, project_id = _fetch_port_and_project(db, port_id)
     try:
-        require_lock(db, port.host.project_id, "port", port_id, current_user)
+        require_lock(db, project_id, "port", port_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-    base = os.path.join(settings.attachments_dir, "evidence", "port", str(port_id))
-    os.makedirs(base, exist_ok=True)
-    ext = os.path.splitext(file.filename or "file")[1] or ""
-    fname = f"{uuid_mod.uuid4().hex}{ext}"
-    path = os.path.join(base, fname)
-    with open(path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    size = os.path.getsize(path)
+    ext = ext_for(file.filename or "file")
+    path, size, digest = store_blob(file.file, ext)
     ev = Evidence(
-        project_id=port.host.project_id,
+        project_id=project_id,
         host_id=port.host_id,
         port_id=port_id,
         filename=file.filename or "uploaded",
         mime=file.content_type,
         size=size,
+        sha256=digest,
         stored_path=path,
         is_pasted=False,
         created_by_user_id=current_user.id,
     )
     db.add(ev)
-    log_audit(
-        db,
-        project_id=port.host.project_id,
+    db.commit()
+    db.refresh(ev)
+    background.add_task(
+        log_audit_background,
+        project_id=project_id,
         user_id=current_user.id,
         action_type="port_attachment_uploaded",
         record_type="port",
         record_id=port_id,
         after_json={"attachment_id": str(ev.id), "filename": ev.filename},
     )
-    db.commit()
-    db.refresh(ev)
     return EvidenceRead(
         id=ev.id,
         port_id=ev.port_id,
@@ -277,47 +346,41 @@ def upload_port_attachment(
 @router.post("/{port_id}/attachments/paste", response_model=EvidenceRead, status_code=201)
 def paste_port_screenshot(
     port_id: UUID,
+    background: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    port = db.query(Port).filter(Port.id == port_id).first()
-    if not port:
-        raise HTTPException(status_code=404, detail="Port not found")
+    port, project_id = _fetch_port_and_project(db, port_id)
     try:
-        require_lock(db, port.host.project_id, "port", port_id, current_user)
+        require_lock(db, project_id, "port", port_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-    base = os.path.join(settings.attachments_dir, "evidence", "port", str(port_id))
-    os.makedirs(base, exist_ok=True)
-    fname = f"{uuid_mod.uuid4().hex}.png"
-    path = os.path.join(base, fname)
-    with open(path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    size = os.path.getsize(path)
+    path, size, digest = store_blob(file.file, ".png")
     ev = Evidence(
-        project_id=port.host.project_id,
+        project_id=project_id,
         host_id=port.host_id,
         port_id=port_id,
         filename="Pasted Screenshot",
         mime=file.content_type or "image/png",
         size=size,
+        sha256=digest,
         stored_path=path,
         is_pasted=True,
         created_by_user_id=current_user.id,
     )
     db.add(ev)
-    log_audit(
-        db,
-        project_id=port.host.project_id,
+    db.commit()
+    db.refresh(ev)
+    background.add_task(
+        log_audit_background,
+        project_id=project_id,
         user_id=current_user.id,
         action_type="port_screenshot_pasted",
         record_type="port",
         record_id=port_id,
         after_json={"attachment_id": str(ev.id)},
     )
-    db.commit()
-    db.refresh(ev)
     return EvidenceRead(
         id=ev.id,
         port_id=ev.port_id,
@@ -365,7 +428,6 @@ def update_port_attachment_notes(
 ):
     ev = (
         db.query(Evidence)
-        .options(joinedload(Evidence.uploaded_by))
         .filter(Evidence.id == att_id, Evidence.port_id == port_id)
         .first()
     )
@@ -386,7 +448,7 @@ def update_port_attachment_notes(
         is_pasted=bool(ev.is_pasted),
         source=ev.source,
         notes_md=ev.notes_md,
-        uploaded_by_username=ev.uploaded_by.username if ev.uploaded_by else None,
+        uploaded_by_username=ev.uploaded_by_username,
         created_at=ev.created_at,
         imported_at=ev.imported_at,
         source_file=ev.source_file,
@@ -398,30 +460,32 @@ def update_port_attachment_notes(
 def delete_port_attachment(
     port_id: UUID,
     att_id: UUID,
+    background: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    port = db.query(Port).filter(Port.id == port_id).first()
-    if not port:
-        raise HTTPException(status_code=404, detail="Port not found")
+    port, project_id = _fetch_port_and_project(db, port_id)
     try:
-        require_lock(db, port.host.project_id, "port", port_id, current_user)
+        require_lock(db, project_id, "port", port_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     ev = db.query(Evidence).filter(Evidence.id == att_id, Evidence.port_id == port_id).first()
     if not ev:
         raise HTTPException(status_code=404, detail="Attachment not found")
-    if ev.stored_path and os.path.isfile(ev.stored_path):
-        os.remove(ev.stored_path)
-    log_audit(
-        db,
-        project_id=port.host.project_id,
+    att_id_str, filename = str(ev.id), ev.filename
+    stored_path = ev.stored_path
+    db.delete(ev)
+    db.commit()
+    # Unlink only after the row deletion has committed: an orphaned blob is
+    # harmless, a surviving row pointing at a missing file is not.
+    background.add_task(remove_blob_if_unused_background, stored_path)
+    background.add_task(
+        log_audit_background,
+        project_id=project_id,
         user_id=current_user.id,
         action_type="port_attachment_removed",
         record_type="port",
         record_id=port_id,
-        before_json={"attachment_id": str(ev.id), "filename": ev.filename},
+        before_json={"attachment_id": att_id_str, "filename": filename},
     )
-    db.delete(ev)
-    db.commit()
     return None
@@ -1,22 +1,29 @@
+import asyncio
+import contextlib
 import csv
 import io
 import logging
 import os
+import tempfile
 import threading
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, File, HTTPException, Request, UploadFile
-from fastapi.responses import JSONResponse, StreamingResponse
-from sqlalchemy.orm import Session
+import orjson
+from pydantic import TypeAdapter
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import delete as sa_delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, contains_eager
 
 from app.core.admin_deps import require_admin
 from app.core.config import settings
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_project_or_404
 from app.db.session import get_db
-from app.models.models import AuditEvent, Evidence, Host, ItemTag, Lock, Port, Project, SavedReport, Tag, User, VulnerabilityDefinition
+from app.models.models import AuditEvent, Evidence, Host, ItemTag, Port, Project, SavedReport, Tag, User, VulnerabilityDefinition
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectRead, ProjectSortModeUpdate, ImportFromPathBody, WhoisLookupBody, WhoisLookupResponse
 from app.schemas.tag import TagCreate, TagUpdate, TagRead, ItemTagCreate, ItemTagRead, ItemTagBulkCreate, ItemTagBulkResponse
 from app.schemas.report import (
@@ -39,7 +46,7 @@ from app.schemas.report import (
     SavedReportCreateV3,
     SavedReportUpdateV2,
 )
-from app.services.audit import log_audit
+from app.services.audit import log_audit, log_audit_background
 from app.services.report_builder_service import (
     execute_report,
     SERVICE_CURRENT_COLUMNS,
@@ -53,18 +60,65 @@ from app.db.session import SessionLocal
 from app.services.import_dispatcher import run_import, run_gowitness_import_from_path
 from app.services.whois_lookup import run_whois_lookup
 from app.services.import_job_store import create_job, get_job, set_failed, set_progress, set_result
-from app.services.reports import run_report, list_report_configs, run_builder, BUILDER_COLUMNS, _builder_columns_json, ReportFilters
+from app.services.sort import invalidate_project_sort_mode
+from app.services.list_cache import invalidate_lists
+from app.api.routes.subnets import _subnet_list_cache_keys
+from app.api.routes.todos import _todo_list_cache_keys
+from app.services.reports import run_report, list_report_configs, run_builder, iter_builder_rows, BUILDER_COLUMNS, _builder_columns_json, ReportFilters
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Compiled once: validating + dumping through a prebuilt TypeAdapter skips
+# FastAPI's generic response-model path on the hot project listing.
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[ProjectRead])
 
-@router.get("", response_model=list[ProjectRead])
+# Builder columns are static metadata, identical for every project and
+# request — serialize them once at import time.
+_BUILDER_COLUMNS_CACHED = orjson.dumps(_builder_columns_json())
+
+
+# Nearly every handler in this module starts by proving the project exists
+# just to return 404 — one SELECT per request for a fact that only changes
+# when a project is deleted. Cache positive lookups keyed by (project_id,
+# epoch); delete_project bumps the epoch, orphaning every cached entry.
+# Negative results are never cached, so newly created projects are visible
+# immediately.
+_project_epoch = 0
+_project_exists_cache: set[tuple[UUID, int]] = set()
+_PROJECT_EXISTS_CACHE_MAX = 4096
+
+
+def _bump_project_epoch() -> None:
+    global _project_epoch
+    _project_epoch += 1
+    _project_exists_cache.clear()
+
+
+def _require_project(db: Session, project_id: UUID) -> None:
+    """Raise 404 unless the project exists; cheap after the first hit."""
+    key = (project_id, _project_epoch)
+    if key in _project_exists_cache:
+        return
+    # EXISTS: the database answers with a single boolean, nothing to hydrate.
+    if not db.query(db.query(Project.id).filter(Project.id == project_id).exists()).scalar():
+        raise HTTPException(status_code=404, detail="Project not found")
+    if len(_project_exists_cache) >= _PROJECT_EXISTS_CACHE_MAX:
+        _project_exists_cache.clear()
+    _project_exists_cache.add(key)
+
+
+@router.get("")
 def list_projects(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return db.query(Project).order_by(Project.created_at.desc()).all()
+    # 2.0-style select; ProjectRead exposes every Project column, so there
+    # is nothing to defer with load_only here.
+    stmt = select(Project).order_by(Project.created_at.desc())
+    rows = db.execute(stmt).scalars().all()
+    models = _PROJECT_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return Response(content=_PROJECT_LIST_ADAPTER.dump_json(models), media_type="application/json")
 
 
 @router.post("", response_model=ProjectRead, status_code=201)
@@ -83,8 +137,9 @@ def create_project(
         scope_policy=body.scope_policy,
     )
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    # flush populates project.id for the audit row; one commit covers both
+    # the project and its audit event.
+    db.flush()
     log_audit(
         db,
         project_id=project.id,
@@ -101,13 +156,9 @@ def create_project(
 
 @router.get("/{project_id}", response_model=ProjectRead)
 def get_project(
-    project_id: UUID,
-    db: Session = Depends(get_db),
+    project: Project = Depends(get_project_or_404),
     current_user: User = Depends(get_current_user),
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
@@ -123,37 +174,62 @@ TOOL_RUN_ACTIONS = {
 }
 
 
+# Tool-run action names all start with the tool name; precompute the mapping
+# so per-row resolution is one dict lookup instead of substring scans.
+_ACTION_TO_TOOL = {a: a.split("_", 1)[0] for a in TOOL_RUN_ACTIONS}
+
+
 def _action_to_tool(action_type: str) -> str:
-    if "nmap" in action_type:
-        return "nmap"
-    if "gowitness" in action_type:
-        return "gowitness"
-    if "text" in action_type:
-        return "text"
-    if "masscan" in action_type:
-        return "masscan"
-    return "unknown"
+    return _ACTION_TO_TOOL.get(action_type, "unknown")
 
 
 @router.get("/{project_id}/tool-runs")
 def list_tool_runs(
     project_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List import/tool run events for the project (nmap, gowitness, text)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    """List import/tool run events for the project (nmap, gowitness, text).
+
+    Keyset-paginated: pass the returned next_cursor as ?cursor= to fetch
+    older events. The cursor is "<created_at>|<id>"; the id tiebreaker
+    matters because rows committed in one transaction share the same
+    now(), and a bare created_at cursor would skip ties that straddle a
+    page boundary. Only the projected columns are fetched — no ORM
+    hydration of full AuditEvent rows.
+    """
+    _require_project(db, project_id)
     q = (
-        db.query(AuditEvent)
+        db.query(
+            AuditEvent.id,
+            AuditEvent.created_at,
+            AuditEvent.action_type,
+            AuditEvent.after_json,
+        )
         .filter(
             AuditEvent.project_id == project_id,
             AuditEvent.action_type.in_(TOOL_RUN_ACTIONS),
         )
-        .order_by(AuditEvent.created_at.desc())
+        .order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
+    )
+    if cursor is not None:
+        ts_raw, _, id_raw = cursor.partition("|")
+        try:
+            cursor_ts = datetime.fromisoformat(ts_raw)
+            cursor_id = UUID(id_raw) if id_raw else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if cursor_id is not None:
+            q = q.filter(tuple_(AuditEvent.created_at, AuditEvent.id) < tuple_(cursor_ts, cursor_id))
+        else:
+            # Bare-timestamp cursors from before the id tiebreaker.
+            q = q.filter(AuditEvent.created_at < cursor_ts)
+    rows = q.limit(limit).all()
+    next_cursor = (
+        f"{rows[-1].created_at.isoformat()}|{rows[-1].id}" if len(rows) == limit else None
     )
-    rows = q.all()
     return {
         "events": [
             {
@@ -165,6 +241,7 @@ def list_tool_runs(
             }
             for r in rows
         ],
+        "next_cursor": next_cursor,
     }
 
 
@@ -176,9 +253,7 @@ def whois_lookup(
     current_user: User = Depends(get_current_user),
 ):
     """Run whois/RDAP lookup for a host, all hosts in a subnet, or a single IP. Updates host(s) whois_data."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     if not body.host_id and not body.subnet_id and not body.ip:
         raise HTTPException(status_code=400, detail="Provide host_id, subnet_id, or ip")
     updated, errors = run_whois_lookup(
@@ -193,36 +268,35 @@ def whois_lookup(
 
 @router.patch("/{project_id}", response_model=ProjectRead)
 def update_project(
-    project_id: UUID,
     body: ProjectUpdate,
+    project: Project = Depends(get_project_or_404),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
     data = body.model_dump(exclude_unset=True)
-    for k, v in data.items():
-        setattr(project, k, v)
-    db.commit()
-    db.refresh(project)
+    if data:
+        # One direct UPDATE; skips per-attribute change tracking and flush
+        # events for what is a plain column write.
+        db.query(Project).filter(Project.id == project.id).update(data, synchronize_session=False)
+        db.commit()
+        db.refresh(project)
+        if "sort_mode" in data:
+            invalidate_project_sort_mode(project.id)
     return project
 
 
 @router.patch("/{project_id}/sort-mode", response_model=ProjectRead)
 def update_project_sort_mode(
-    project_id: UUID,
     body: ProjectSortModeUpdate,
+    project: Project = Depends(get_project_or_404),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update project sort_mode (any user with project access)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
     project.sort_mode = body.sort_mode
     db.commit()
     db.refresh(project)
+    invalidate_project_sort_mode(project.id)
     return project
 
 
@@ -236,44 +310,43 @@ def _get_client_ip(request: Request) -> str | None:
 ALLOWED_IMPORT_EXTENSIONS = (".xml", ".zip", ".txt", ".json", ".masscan", ".lst")
 
 
-def _aggregate_import_results(results: list[dict], formats: list[str]) -> dict:
+_NUMERIC_KEYS = (
+    "hosts_created",
+    "hosts_updated",
+    "subnets_updated",
+    "ports_created",
+    "ports_updated",
+    "evidence_created",
+    "notes_created",
+    "screenshots_imported",
+    "metadata_records_imported",
+    "skipped",
+)
+
+# Zero-initialized aggregate, built once; callers take a shallow copy and
+# replace the mutable "errors" entry.
+_EMPTY_AGG = {
+    "format": "unknown",
+    **{k: 0 for k in _NUMERIC_KEYS},
+    "errors": [],
+    "files_processed": 0,
+}
+
+
+def _aggregate_import_results(results: list[dict], unified_format: str | None, is_mixed: bool) -> dict:
     """Sum numeric fields and concatenate errors; set format to first or 'mixed'."""
     if not results:
-        return {
-            "format": "unknown",
-            "hosts_created": 0,
-            "hosts_updated": 0,
-            "subnets_updated": 0,
-            "ports_created": 0,
-            "ports_updated": 0,
-            "evidence_created": 0,
-            "notes_created": 0,
-            "screenshots_imported": 0,
-            "metadata_records_imported": 0,
-            "skipped": 0,
-            "errors": [],
-            "files_processed": 0,
-        }
-    numeric_keys = (
-        "hosts_created",
-        "hosts_updated",
-        "subnets_updated",
-        "ports_created",
-        "ports_updated",
-        "evidence_created",
-        "notes_created",
-        "screenshots_imported",
-        "metadata_records_imported",
-        "skipped",
-    )
-    agg = {k: 0 for k in numeric_keys}
-    agg["errors"] = []
+        agg = _EMPTY_AGG.copy()
+        agg["errors"] = []
+        return agg
+    agg = {k: 0 for k in _NUMERIC_KEYS}
+    errors: list[str] = []
     for r in results:
-        for k in numeric_keys:
+        for k in _NUMERIC_KEYS:
             agg[k] += r.get(k) or 0
-        for e in r.get("errors") or []:
-            agg["errors"].append(e)
-    agg["format"] = formats[0] if len(set(formats)) == 1 else "mixed"
+        errors.extend(r.get("errors") or ())
+    agg["errors"] = errors
+    agg["format"] = "mixed" if is_mixed else (unified_format or "unknown")
     agg["files_processed"] = len(results)
     return agg
 
@@ -301,17 +374,58 @@ async def import_scan(
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
 
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
 
     request_ip = _get_client_ip(request)
     results: list[dict] = []
-    formats_used: list[str] = []
+    # Running format summary: one scalar comparison per file instead of
+    # collecting every format and building a set at the end.
+    unified_format: str | None = None
+    is_mixed = False
+
+    def _note_format(fmt: str) -> None:
+        nonlocal unified_format, is_mixed
+        if unified_format is None:
+            unified_format = fmt
+        elif fmt != unified_format:
+            is_mixed = True
+
+    # Spool each upload to a temp file in 1 MiB chunks while the previous
+    # file is importing in a worker thread: reads overlap the parse + DB
+    # work, and peak memory stays at ~chunk size per upload rather than the
+    # whole file (ZIPs are then read straight from disk by run_import).
+    read_tasks: dict[int, asyncio.Task] = {}
+
+    async def _spool(upload: UploadFile) -> Path:
+        suffix = Path(upload.filename or "upload").suffix.lower() or ".bin"
+        tmp = tempfile.NamedTemporaryFile(delete=False, prefix="redopsync_import_", suffix=suffix)
+        try:
+            while chunk := await upload.read(1 << 20):
+                tmp.write(chunk)
+        except BaseException:
+            # The caller only sees the exception, never the path; unlink the
+            # partial spool here or it leaks one temp file per failed upload.
+            tmp.close()
+            with contextlib.suppress(OSError):
+                os.unlink(tmp.name)
+            raise
+        finally:
+            tmp.close()
+        return Path(tmp.name)
+
+    def _schedule_read(idx: int) -> None:
+        if idx >= len(files):
+            return
+        fn_next = (files[idx].filename or "").strip().lower()
+        if fn_next.endswith(ALLOWED_IMPORT_EXTENSIONS):
+            read_tasks[idx] = asyncio.create_task(_spool(files[idx]))
+
+    _schedule_read(0)
 
-    for upload in files:
+    for i, upload in enumerate(files):
+        _schedule_read(i + 1)
         fn = (upload.filename or "").strip().lower()
-        if not any(fn.endswith(ext) for ext in ALLOWED_IMPORT_EXTENSIONS):
+        if not fn.endswith(ALLOWED_IMPORT_EXTENSIONS):
             results.append({
                 "format": "unknown",
                 "hosts_created": 0,
@@ -320,10 +434,10 @@ async def import_scan(
                 "ports_updated": 0,
                 "errors": [f"{upload.filename}: Unsupported file type. Use Nmap XML (.xml), GoWitness/ZIP (.zip), plain text (.txt), Masscan list (.masscan, .lst, or .txt), or whois/RDAP JSON (.json)."],
             })
-            formats_used.append("unknown")
+            _note_format("unknown")
             continue
         try:
-            data = await upload.read()
+            data_path = await read_tasks.pop(i)
         except Exception as e:
             results.append({
                 "format": "unknown",
@@ -333,45 +447,51 @@ async def import_scan(
                 "ports_updated": 0,
                 "errors": [f"{upload.filename}: Failed to read file — {e}"],
             })
-            formats_used.append("unknown")
-            continue
-        if len(data) == 0:
-            results.append({
-                "format": "unknown",
-                "hosts_created": 0,
-                "hosts_updated": 0,
-                "ports_created": 0,
-                "ports_updated": 0,
-                "errors": [f"{upload.filename}: Empty file"],
-            })
-            formats_used.append("unknown")
+            _note_format("unknown")
             continue
         try:
-            result = run_import(
-                db,
-                project_id,
-                data,
-                upload.filename or "upload",
-                current_user.id,
-                request_ip,
-            )
-            # Prefix errors with filename so user can see which file had which error
-            errors = result.get("errors") or []
-            result["errors"] = [f"{upload.filename}: {e}" if e else f"{upload.filename}" for e in errors]
-            results.append(result)
-            formats_used.append((result.get("format") or "unknown"))
-        except ValueError as e:
-            results.append({
-                "format": "unknown",
-                "hosts_created": 0,
-                "hosts_updated": 0,
-                "ports_created": 0,
-                "ports_updated": 0,
-                "errors": [f"{upload.filename}: {e}"],
-            })
-            formats_used.append("unknown")
-
-    return _aggregate_import_results(results, formats_used)
+            if data_path.stat().st_size == 0:
+                results.append({
+                    "format": "unknown",
+                    "hosts_created": 0,
+                    "hosts_updated": 0,
+                    "ports_created": 0,
+                    "ports_updated": 0,
+                    "errors": [f"{upload.filename}: Empty file"],
+                })
+                _note_format("unknown")
+                continue
+            try:
+                # run_import does blocking parse + DB work; to_thread keeps the
+                # event loop serving other requests while this file imports.
+                result = await asyncio.to_thread(
+                    run_import,
+                    db,
+                    project_id,
+                    data_path,
+                    upload.filename or "upload",
+                    current_user.id,
+                    request_ip,
+                )
+                # Prefix errors with filename so user can see which file had which error
+                fn_label = upload.filename or "upload"
+                result["errors"] = [f"{fn_label}: {e}" for e in result.get("errors") or ()]
+                results.append(result)
+                _note_format(result.get("format") or "unknown")
+            except ValueError as e:
+                results.append({
+                    "format": "unknown",
+                    "hosts_created": 0,
+                    "hosts_updated": 0,
+                    "ports_created": 0,
+                    "ports_updated": 0,
+                    "errors": [f"{upload.filename}: {e}"],
+                })
+                _note_format("unknown")
+        finally:
+            data_path.unlink(missing_ok=True)
+
+    return _aggregate_import_results(results, unified_format, is_mixed)
 
 
 def _resolve_import_path(path_str: str) -> tuple[Path, Path]:
@@ -395,9 +515,7 @@ def list_import_from_path_files(
     current_user: User = Depends(get_current_user),
 ):
     """List files and directories in the server's import directory (IMPORT_FROM_PATH_DIR). Paths are relative for use with POST import-from-path."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     base = Path(settings.import_from_path_dir).resolve()
     base.mkdir(parents=True, exist_ok=True)
     if not base.is_dir():
@@ -412,7 +530,7 @@ def list_import_from_path_files(
                 continue
             if entry.is_dir():
                 files.append({"name": entry.name, "path": path_str, "is_dir": True})
-            elif entry.is_file() and any(entry.name.lower().endswith(ext) for ext in ALLOWED_IMPORT_EXTENSIONS):
+            elif entry.is_file() and entry.name.lower().endswith(ALLOWED_IMPORT_EXTENSIONS):
                 files.append({"name": entry.name, "path": path_str, "is_dir": False})
     except OSError as e:
         logger.warning("List import dir failed: %s", e)
@@ -538,13 +656,11 @@ async def import_from_path_upload(
     Returns 202 with job_id; poll GET /import-jobs/{job_id} for status and progress.
     Same supported formats as regular import. Use for large files to avoid timeouts.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     if not file.filename or not (file.filename or "").strip():
         raise HTTPException(status_code=400, detail="No file provided")
     fn = (file.filename or "upload").strip()
-    if not any(fn.lower().endswith(ext) for ext in ALLOWED_IMPORT_EXTENSIONS):
+    if not fn.lower().endswith(ALLOWED_IMPORT_EXTENSIONS):
         raise HTTPException(
             status_code=400,
             detail="Unsupported file type. Use .xml, .zip, .txt, .json, .masscan, or .lst",
@@ -555,16 +671,20 @@ async def import_from_path_upload(
     if not safe_name or safe_name.startswith(".") or ".." in safe_name or "/" in safe_name or "\\" in safe_name:
         raise HTTPException(status_code=400, detail="Invalid filename")
     dest = base / safe_name
+    # Stream the upload to disk in chunks: no whole-file bytes object on the
+    # event loop, so other requests keep being served during a large save.
+    size = 0
     try:
-        content = await file.read()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to read file: {e}")
-    if len(content) == 0:
-        raise HTTPException(status_code=400, detail="File is empty")
-    try:
-        dest.write_bytes(content)
+        with dest.open("wb") as out:
+            while chunk := await file.read(1 << 20):
+                out.write(chunk)
+                size += len(chunk)
     except Exception as e:
+        dest.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Failed to save file on server: {e}")
+    if size == 0:
+        dest.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="File is empty")
 
     job_id = create_job(project_id)
     request_ip = _get_client_ip(request)
@@ -589,9 +709,7 @@ def get_import_job(
     current_user: User = Depends(get_current_user),
 ):
     """Get status and progress of an async import job. Poll until status is completed or failed."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     job = get_job(job_id, project_id)
     if not job:
         logger.info("Import job poll 404 job_id=%s project_id=%s", job_id, project_id)
@@ -611,16 +729,14 @@ def import_from_path_start(
     Start import from a file or directory on the server (path relative to IMPORT_FROM_PATH_DIR).
     Returns 202 with job_id; poll GET /import-jobs/{job_id} for status. Use for large files to avoid timeouts.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     path_str = (body.path or "").strip()
     if not path_str:
         raise HTTPException(status_code=400, detail="Path is required")
     _base, full = _resolve_import_path(path_str)
     if not full.exists():
         raise HTTPException(status_code=404, detail="File or directory not found")
-    if full.is_file() and not any(full.name.lower().endswith(ext) for ext in ALLOWED_IMPORT_EXTENSIONS):
+    if full.is_file() and not full.name.lower().endswith(ALLOWED_IMPORT_EXTENSIONS):
         raise HTTPException(
             status_code=400,
             detail="Unsupported file type. Use .xml, .zip, .txt, .json, .masscan, or .lst",
@@ -648,9 +764,7 @@ def import_from_path(
     Import from a file or directory on the server (synchronous). Path is relative to the import directory.
     For large files prefer POST /import-from-path/start (returns 202, poll import-jobs).
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
 
     path_str = (body.path or "").strip()
     if not path_str:
@@ -663,7 +777,7 @@ def import_from_path(
     request_ip = _get_client_ip(request)
 
     if full.is_file():
-        if not any(full.name.lower().endswith(ext) for ext in ALLOWED_IMPORT_EXTENSIONS):
+        if not full.name.lower().endswith(ALLOWED_IMPORT_EXTENSIONS):
             raise HTTPException(
                 status_code=400,
                 detail="Unsupported file type. Use .xml, .zip, .txt, .json, .masscan, or .lst",
@@ -752,10 +866,8 @@ def get_builder_columns(
     current_user: User = Depends(get_current_user),
 ):
     """Get available columns per data source for report builder."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return _builder_columns_json()
+    _require_project(db, project_id)
+    return Response(content=_BUILDER_COLUMNS_CACHED, media_type="application/json")
 
 
 @router.get("/{project_id}/reports/service-current/columns")
@@ -765,9 +877,7 @@ def get_service_current_columns(
     current_user: User = Depends(get_current_user),
 ):
     """Get available columns for Report Builder (service_current view)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     return {
         "service_current": [
             [cid, SERVICE_CURRENT_COLUMN_LABELS.get(cid, cid)]
@@ -784,9 +894,7 @@ def get_reporting_fields(
     current_user: User = Depends(get_current_user),
 ):
     """Get field metadata for selected sources (e.g. ?sources=core,nmap,http). Mission-scoped."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     source_list = [s.strip() for s in sources.split(",") if s.strip()]
     fields = get_fields_for_sources(source_list)
     return ReportingFieldsResponse(fields=fields)
@@ -800,9 +908,7 @@ def execute_reporting(
     current_user: User = Depends(get_current_user),
 ):
     """Execute Report Builder definition (Group/Condition DSL). Mission-scoped."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     try:
         columns, rows, total_count = execute_report_v2(db, project_id, body.definition)
     except Exception as e:
@@ -858,9 +964,7 @@ def seed_reporting_examples(
     current_user: User = Depends(get_current_user),
 ):
     """Create 3 example saved reports if none exist with these names. Mission-scoped."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     existing_names = {r.name for r in db.query(SavedReport).filter(SavedReport.project_id == project_id).all()}
     created = 0
     for ex in REPORTING_SEED_EXAMPLES:
@@ -883,24 +987,66 @@ def seed_reporting_examples(
     return {"created": created}
 
 
+def _stream_builder_ndjson(db, rows_iter, audit_kwargs: dict):
+    """Yield builder rows as NDJSON, then audit with the streamed row count."""
+
+    def gen():
+        count = 0
+        for row in rows_iter:
+            count += 1
+            yield orjson.dumps(row) + b"\n"
+        audit_kwargs["after_json"]["row_count"] = count
+        log_audit(db, **audit_kwargs)
+        db.commit()
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
 @router.post("/{project_id}/reports/builder", response_model=ReportRunResponse)
 def run_report_builder(
     project_id: UUID,
     body: ReportBuilderRequest,
     request: Request,
+    background: BackgroundTasks,
+    stream: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Run report builder: select columns + filter expression."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    """Run report builder: select columns + filter expression.
+
+    With ``stream=true`` rows are emitted as NDJSON one at a time instead of
+    being materialized into a single JSON body.
+    """
+    _require_project(db, project_id)
+    if stream:
+        try:
+            rows_iter = iter_builder_rows(db, project_id, body.data_source, body.columns, body.filter_expression)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return _stream_builder_ndjson(
+            db,
+            rows_iter,
+            {
+                "project_id": project_id,
+                "user_id": current_user.id,
+                "action_type": "report_builder_generated",
+                "record_type": "project",
+                "record_id": project_id,
+                "after_json": {
+                    "data_source": body.data_source,
+                    "columns": body.columns,
+                    "filter_expression": body.filter_expression,
+                },
+                "ip_address": _get_client_ip(request),
+            },
+        )
     try:
         rows = run_builder(db, project_id, body.data_source, body.columns, body.filter_expression)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    log_audit(
-        db,
+    # Audit after the response: the commit existed only for the audit row.
+    background.add_task(
+        log_audit_background,
         project_id=project_id,
         user_id=current_user.id,
         action_type="report_builder_generated",
@@ -914,7 +1060,6 @@ def run_report_builder(
         },
         ip_address=_get_client_ip(request),
     )
-    db.commit()
     return ReportRunResponse(
         report_type="builder",
         report_name="Report builder",
@@ -931,9 +1076,7 @@ def execute_report_definition(
     current_user: User = Depends(get_current_user),
 ):
     """Execute ad-hoc report definition (no save). Mission-scoped."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     try:
         columns, rows, total_count = execute_report(db, project_id, body.definition)
     except Exception as e:
@@ -941,18 +1084,41 @@ def execute_report_definition(
     return ExecuteReportResponse(columns=columns, rows=rows, total_count=total_count)
 
 
-@router.get("/{project_id}/reports/saved", response_model=list[SavedReportRead])
+def _saved_report_to_dict(sr: SavedReport) -> dict:
+    """Plain-dict form of SavedReportRead for the list endpoint.
+
+    definition_json is written via model_dump at save time, so it is passed
+    through as-is instead of being re-validated per row.
+    """
+    definition_json = getattr(sr, "definition_json", None)
+    return {
+        "id": sr.id,
+        "project_id": sr.project_id,
+        "name": sr.name,
+        "description": sr.description,
+        "query_definition": {
+            "data_source": sr.data_source,
+            "columns": sr.columns or [],
+            "filter_expression": sr.filter_expression or "",
+        },
+        "definition": definition_json,
+        "definition_json": definition_json,
+        "created_at": sr.created_at,
+        "updated_at": getattr(sr, "updated_at", None),
+        "created_by_user_id": getattr(sr, "created_by_user_id", None),
+    }
+
+
+@router.get("/{project_id}/reports/saved")
 def list_saved_reports(
     project_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List saved report definitions for the project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     reports = db.query(SavedReport).filter(SavedReport.project_id == project_id).order_by(SavedReport.created_at.desc()).all()
-    return [_saved_report_to_read(r) for r in reports]
+    return [_saved_report_to_dict(r) for r in reports]
 
 
 @router.post("/{project_id}/reports/saved", response_model=SavedReportRead, status_code=201)
@@ -963,9 +1129,7 @@ def create_saved_report(
     current_user: User = Depends(get_current_user),
 ):
     """Save a report definition (legacy: query_definition)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     q = body.query_definition
     if q.data_source not in ("hosts", "ports", "evidence", "vulns", "service_current"):
         raise HTTPException(status_code=400, detail="Invalid data_source")
@@ -992,9 +1156,7 @@ def create_saved_report_v2(
     current_user: User = Depends(get_current_user),
 ):
     """Save a report definition (Report Builder: definition_json)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     defn = body.definition
     sr = SavedReport(
         project_id=project_id,
@@ -1020,9 +1182,7 @@ def create_saved_report_v3(
     current_user: User = Depends(get_current_user),
 ):
     """Save a report definition (Visual Report Builder: ReportDefinitionV2 with Group/Condition filter)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     defn = body.definition
     column_keys = [c.key for c in (defn.columns or [])]
     sr = SavedReport(
@@ -1050,11 +1210,9 @@ def update_saved_report(
     current_user: User = Depends(get_current_user),
 ):
     """Update a saved report (name, description, definition - legacy ReportDefinition)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    sr = db.query(SavedReport).filter(SavedReport.id == report_id, SavedReport.project_id == project_id).first()
-    if not sr:
+    _require_project(db, project_id)
+    sr = db.get(SavedReport, report_id)
+    if not sr or sr.project_id != project_id:
         raise HTTPException(status_code=404, detail="Saved report not found")
     if body.name is not None:
         sr.name = body.name
@@ -1080,11 +1238,9 @@ def update_saved_report_v2(
     current_user: User = Depends(get_current_user),
 ):
     """Update a saved report (Visual Report Builder: ReportDefinitionV2)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    sr = db.query(SavedReport).filter(SavedReport.id == report_id, SavedReport.project_id == project_id).first()
-    if not sr:
+    _require_project(db, project_id)
+    sr = db.get(SavedReport, report_id)
+    if not sr or sr.project_id != project_id:
         raise HTTPException(status_code=404, detail="Saved report not found")
     if body.name is not None:
         sr.name = body.name
@@ -1110,11 +1266,9 @@ def delete_saved_report(
     current_user: User = Depends(get_current_user),
 ):
     """Delete a saved report."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    sr = db.query(SavedReport).filter(SavedReport.id == report_id, SavedReport.project_id == project_id).first()
-    if not sr:
+    _require_project(db, project_id)
+    sr = db.get(SavedReport, report_id)
+    if not sr or sr.project_id != project_id:
         raise HTTPException(status_code=404, detail="Saved report not found")
     db.delete(sr)
     db.commit()
@@ -1130,11 +1284,9 @@ def export_saved_report(
     current_user: User = Depends(get_current_user),
 ):
     """Run saved report and export as CSV or JSON. format=csv|json."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    sr = db.query(SavedReport).filter(SavedReport.id == report_id, SavedReport.project_id == project_id).first()
-    if not sr:
+    _require_project(db, project_id)
+    sr = db.get(SavedReport, report_id)
+    if not sr or sr.project_id != project_id:
         raise HTTPException(status_code=404, detail="Saved report not found")
     if sr.definition_json:
         try:
@@ -1185,16 +1337,37 @@ def run_saved_report(
     project_id: UUID,
     report_id: UUID,
     request: Request,
+    stream: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Run a saved report and return tabular data (results not stored)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    sr = db.query(SavedReport).filter(SavedReport.id == report_id, SavedReport.project_id == project_id).first()
-    if not sr:
+    """Run a saved report and return tabular data (results not stored).
+
+    Builder-style saved reports support ``stream=true`` to emit rows as
+    NDJSON instead of a single JSON body.
+    """
+    _require_project(db, project_id)
+    sr = db.get(SavedReport, report_id)
+    if not sr or sr.project_id != project_id:
         raise HTTPException(status_code=404, detail="Saved report not found")
+    if stream and not sr.definition_json:
+        try:
+            rows_iter = iter_builder_rows(db, project_id, sr.data_source, sr.columns or [], sr.filter_expression or "")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return _stream_builder_ndjson(
+            db,
+            rows_iter,
+            {
+                "project_id": project_id,
+                "user_id": current_user.id,
+                "action_type": "saved_report_run",
+                "record_type": "saved_report",
+                "record_id": report_id,
+                "after_json": {"name": sr.name},
+                "ip_address": _get_client_ip(request),
+            },
+        )
     if sr.definition_json:
         try:
             d = sr.definition_json
@@ -1242,9 +1415,7 @@ def list_reports(
     current_user: User = Depends(get_current_user),
 ):
     """List available custom report types."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     return [ReportConfigSchema(id=c.id, name=c.name) for c in list_report_configs()]
 
 
@@ -1253,13 +1424,12 @@ def run_custom_report(
     project_id: UUID,
     body: ReportRunRequest,
     request: Request,
+    background: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Run a custom report and return rows."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     f = body.filters
     filters = ReportFilters(
         exclude_unresolved=f.exclude_unresolved if f else True,
@@ -1273,8 +1443,8 @@ def run_custom_report(
         rows, config = run_report(db, project_id, body.report_type, filters)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    log_audit(
-        db,
+    background.add_task(
+        log_audit_background,
         project_id=project_id,
         user_id=current_user.id,
         action_type="custom_report_generated",
@@ -1295,7 +1465,6 @@ def run_custom_report(
         },
         ip_address=_get_client_ip(request),
     )
-    db.commit()
     return ReportRunResponse(
         report_type=config.id,
         report_name=config.name,
@@ -1305,18 +1474,17 @@ def run_custom_report(
 
 
 # ---- Tags (mission-based) ----
-@router.get("/{project_id}/tags", response_model=list[TagRead])
+@router.get("/{project_id}/tags")
 def list_tags(
     project_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List tags for the project (mission). All users in the mission see the same tags."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     tags = db.query(Tag).filter(Tag.project_id == project_id).order_by(Tag.name).all()
-    return [TagRead.model_validate(t) for t in tags]
+    # Plain dicts: skips per-row Pydantic validation on a hot list endpoint.
+    return [{"id": t.id, "project_id": t.project_id, "name": t.name, "color": t.color} for t in tags]
 
 
 @router.post("/{project_id}/tags", response_model=TagRead, status_code=201)
@@ -1327,9 +1495,7 @@ def create_tag(
     current_user: User = Depends(get_current_user),
 ):
     """Create a tag for the project (mission)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
     tag = Tag(project_id=project_id, name=body.name, color=body.color)
     db.add(tag)
     db.commit()
@@ -1346,11 +1512,9 @@ def update_tag(
     current_user: User = Depends(get_current_user),
 ):
     """Update a tag's name and/or color."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    tag = db.query(Tag).filter(Tag.id == tag_id, Tag.project_id == project_id).first()
-    if not tag:
+    _require_project(db, project_id)
+    tag = db.get(Tag, tag_id)
+    if not tag or tag.project_id != project_id:
         raise HTTPException(status_code=404, detail="Tag not found")
     data = body.model_dump(exclude_unset=True)
     for k, v in data.items():
@@ -1368,42 +1532,46 @@ def delete_tag(
     current_user: User = Depends(get_current_user),
 ):
     """Delete a tag from the project (mission). Cascades to item_tags."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    tag = db.query(Tag).filter(Tag.id == tag_id, Tag.project_id == project_id).first()
-    if not tag:
+    _require_project(db, project_id)
+    # Single DELETE instead of fetch-then-delete; the FK's ON DELETE CASCADE
+    # removes the item_tags rows server-side.
+    deleted = (
+        db.query(Tag)
+        .filter(Tag.id == tag_id, Tag.project_id == project_id)
+        .delete(synchronize_session=False)
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Tag not found")
-    db.delete(tag)
     db.commit()
     return None
 
 
-@router.get("/{project_id}/item-tags", response_model=list[ItemTagRead])
+@router.get("/{project_id}/item-tags")
 def list_item_tags(
     project_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List item-tag assignments for the project. Used to show tag child nodes in the tree."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    _require_project(db, project_id)
+    # contains_eager reuses the join to populate it.tag, so the comprehension
+    # below reads tag name/color without a lazy SELECT per row.
     q = (
         db.query(ItemTag)
-        .join(Tag)
+        .join(ItemTag.tag)
+        .options(contains_eager(ItemTag.tag))
         .filter(Tag.project_id == project_id)
     )
     item_tags = q.all()
     return [
-        ItemTagRead(
-            id=it.id,
-            tag_id=it.tag_id,
-            target_type=it.target_type,
-            target_id=it.target_id,
-            tag_name=it.tag.name,
-            tag_color=it.tag.color,
-        )
+        {
+            "id": it.id,
+            "tag_id": it.tag_id,
+            "target_type": it.target_type,
+            "target_id": it.target_id,
+            "tag_name": it.tag.name,
+            "tag_color": it.tag.color,
+        }
         for it in item_tags
     ]
 
@@ -1416,38 +1584,36 @@ def add_item_tag(
     current_user: User = Depends(get_current_user),
 ):
     """Add a tag to a host, port, port_evidence, or vuln_definition."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    tag = db.query(Tag).filter(Tag.id == body.tag_id, Tag.project_id == project_id).first()
-    if not tag:
+    _require_project(db, project_id)
+    tag = db.get(Tag, body.tag_id)
+    if not tag or tag.project_id != project_id:
         raise HTTPException(status_code=404, detail="Tag not found")
-    existing = (
-        db.query(ItemTag)
-        .filter(
-            ItemTag.tag_id == body.tag_id,
-            ItemTag.target_type == body.target_type,
-            ItemTag.target_id == body.target_id,
-        )
-    ).first()
-    if existing:
-        return ItemTagRead(
-            id=existing.id,
-            tag_id=existing.tag_id,
-            target_type=existing.target_type,
-            target_id=existing.target_id,
-            tag_name=tag.name,
-            tag_color=tag.color,
+    # Upsert: one INSERT ... ON CONFLICT DO NOTHING replaces the previous
+    # SELECT-then-INSERT pair; RETURNING gives back the new id directly.
+    stmt = (
+        pg_insert(ItemTag)
+        .values(tag_id=body.tag_id, target_type=body.target_type, target_id=body.target_id)
+        .on_conflict_do_nothing(constraint="uq_item_tag_target")
+        .returning(ItemTag.id)
+    )
+    item_tag_id = db.execute(stmt).scalar()
+    if item_tag_id is None:
+        # Conflict: the assignment already exists (rare path, one extra query).
+        item_tag_id = (
+            db.query(ItemTag.id)
+            .filter(
+                ItemTag.tag_id == body.tag_id,
+                ItemTag.target_type == body.target_type,
+                ItemTag.target_id == body.target_id,
+            )
+            .scalar()
         )
-    item_tag = ItemTag(tag_id=body.tag_id, target_type=body.target_type, target_id=body.target_id)
-    db.add(item_tag)
     db.commit()
-    db.refresh(item_tag)
     return ItemTagRead(
-        id=item_tag.id,
-        tag_id=item_tag.tag_id,
-        target_type=item_tag.target_type,
-        target_id=item_tag.target_id,
+        id=item_tag_id,
+        tag_id=body.tag_id,
+        target_type=body.target_type,
+        target_id=body.target_id,
         tag_name=tag.name,
         tag_color=tag.color,
     )
@@ -1480,11 +1646,9 @@ def add_item_tags_bulk(
     current_user: User = Depends(get_current_user),
 ):
     """Apply one tag to many targets. Idempotent: skips assignments that already exist."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    tag = db.query(Tag).filter(Tag.id == body.tag_id, Tag.project_id == project_id).first()
-    if not tag:
+    _require_project(db, project_id)
+    tag = db.get(Tag, body.tag_id)
+    if not tag or tag.project_id != project_id:
         raise HTTPException(status_code=404, detail="Tag not found")
     created = 0
     skipped = 0
@@ -1516,13 +1680,18 @@ def remove_item_tag(
     current_user: User = Depends(get_current_user),
 ):
     """Remove a tag from an item (called when right-clicking the tag node)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    item_tag = db.query(ItemTag).join(Tag).filter(ItemTag.id == item_tag_id, Tag.project_id == project_id).first()
-    if not item_tag:
+    _require_project(db, project_id)
+    # One DELETE with a project-ownership subquery instead of fetch-then-delete.
+    deleted = (
+        db.query(ItemTag)
+        .filter(
+            ItemTag.id == item_tag_id,
+            ItemTag.tag_id.in_(db.query(Tag.id).filter(Tag.project_id == project_id)),
+        )
+        .delete(synchronize_session=False)
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Item tag not found")
-    db.delete(item_tag)
     db.commit()
     return None
 
@@ -1535,10 +1704,9 @@ def delete_project(
     current_user: User = Depends(require_admin),
 ):
     """Delete project (admin only). Cascades to related data."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    name = db.query(Project.name).filter(Project.id == project_id).scalar()
+    if name is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    name = project.name
     log_audit(
         db,
         project_id=project_id,
@@ -1549,8 +1717,13 @@ def delete_project(
         before_json={"name": name},
         ip_address=_get_client_ip(request),
     )
-    # Delete locks explicitly to avoid SQLAlchemy trying to null project_id (NOT NULL)
-    db.query(Lock).filter(Lock.project_id == project_id).delete(synchronize_session=False)
-    db.delete(project)
+    # One server-side DELETE; every project_id FK (locks included) is
+    # ON DELETE CASCADE, so the database does the whole cleanup.
+    db.execute(sa_delete(Project).where(Project.id == project_id))
     db.commit()
+    _bump_project_epoch()
+    # The cascaded rows are gone; drop their cached list bodies too, or the
+    # todo/subnet lists keep serving 200s with stale rows for up to the TTL.
+    invalidate_lists(_todo_list_cache_keys(project_id) + _subnet_list_cache_keys(project_id))
+    invalidate_project_sort_mode(project_id)
     return None
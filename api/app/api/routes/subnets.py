@@ -1,5 +1,8 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, insert as sa_insert, select, update as sa_update
 from sqlalchemy.orm import Session
 
 from fastapi import status
@@ -8,36 +11,62 @@ from app.core.deps import get_current_user
 from app.db.session import get_db
 from app.models.models import Host, Subnet, Project, User
 from app.schemas.subnet import SubnetCreate, SubnetUpdate, SubnetRead
-from app.services.audit import log_audit
+from app.services.audit import log_audit_background
+from app.services.list_cache import get_cached_list, invalidate_lists, store_list
 from app.services.lock import require_lock
-from app.services.sort import apply_subnet_order, SORT_MODES, DEFAULT_SORT
+from app.services.sort import apply_subnet_order, get_project_sort_mode, SORT_MODES, DEFAULT_SORT
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_SUBNET_LIST_ADAPTER = TypeAdapter(list[SubnetRead])
+
+# Statements built once per sort mode; execution reuses the cached compiled
+# SQL instead of re-constructing and re-compiling the select per request.
+_SUBNET_LIST_STMTS = {mode: apply_subnet_order(select(Subnet), mode) for mode in SORT_MODES}
+_SUBNET_LIST_BY_PROJECT_STMTS = {
+    mode: apply_subnet_order(select(Subnet).where(Subnet.project_id == bindparam("pid")), mode)
+    for mode in SORT_MODES
+}
+
+
+def _subnet_list_cache_keys(project_id: UUID) -> list[str]:
+    # Key variants are enumerable (one per sort mode, plus the unscoped
+    # listing), so writers can invalidate them all with one delete.
+    keys = [f"subnets:list:{project_id}:{m}" for m in SORT_MODES]
+    keys += [f"subnets:list:None:{m}" for m in SORT_MODES]
+    return keys
 
 
 def _resolve_sort_mode(db: Session, project_id: UUID | None, sort_mode: str | None) -> str:
     if sort_mode and sort_mode in SORT_MODES:
         return sort_mode
     if project_id:
-        proj = db.query(Project).filter(Project.id == project_id).first()
-        if proj and getattr(proj, "sort_mode", None) in SORT_MODES:
-            return proj.sort_mode
+        mode = get_project_sort_mode(db, project_id)
+        if mode in SORT_MODES:
+            return mode
     return DEFAULT_SORT
 
 
-@router.get("", response_model=list[SubnetRead])
+@router.get("")
 def list_subnets(
     project_id: UUID | None = Query(None),
     sort_mode: str | None = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(Subnet)
-    if project_id is not None:
-        q = q.filter(Subnet.project_id == project_id)
     mode = _resolve_sort_mode(db, project_id, sort_mode)
-    q = apply_subnet_order(q, mode)
-    return q.all()
+    cache_key = f"subnets:list:{project_id}:{mode}"
+    cached = get_cached_list(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    if project_id is not None:
+        rows = db.execute(_SUBNET_LIST_BY_PROJECT_STMTS[mode], {"pid": project_id}).scalars().all()
+    else:
+        rows = db.execute(_SUBNET_LIST_STMTS[mode]).scalars().all()
+    models = _SUBNET_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    payload = _SUBNET_LIST_ADAPTER.dump_json(models)
+    store_list(cache_key, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("", response_model=SubnetRead, status_code=201)
@@ -46,17 +75,20 @@ def create_subnet(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    project = db.query(Project).filter(Project.id == body.project_id).first()
-    if not project:
+    # EXISTS returns one boolean — no row transfer or ORM hydration just to 404.
+    exists = db.query(db.query(Project.id).filter(Project.id == body.project_id).exists()).scalar()
+    if not exists:
         raise HTTPException(status_code=404, detail="Project not found")
-    subnet = Subnet(
-        project_id=body.project_id,
-        cidr=body.cidr,
-        name=body.name,
+    # INSERT .. RETURNING hands back the row with its generated defaults in
+    # the same round trip, replacing the add/commit/refresh triple.
+    stmt = (
+        sa_insert(Subnet)
+        .values(project_id=body.project_id, cidr=body.cidr, name=body.name)
+        .returning(Subnet)
     )
-    db.add(subnet)
+    subnet = db.execute(stmt).scalar_one()
     db.commit()
-    db.refresh(subnet)
+    invalidate_lists(_subnet_list_cache_keys(body.project_id))
     return subnet
 
 
@@ -66,7 +98,7 @@ def get_subnet(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    subnet = db.query(Subnet).filter(Subnet.id == subnet_id).first()
+    subnet = db.get(Subnet, subnet_id)
     if not subnet:
         raise HTTPException(status_code=404, detail="Subnet not found")
     return subnet
@@ -79,7 +111,9 @@ def update_subnet(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    subnet = db.query(Subnet).filter(Subnet.id == subnet_id).first()
+    # Row lock serializes concurrent writers on this subnet at the DB level,
+    # closing the race between the app-side lock check and the write.
+    subnet = db.get(Subnet, subnet_id, with_for_update=True)
     if not subnet:
         raise HTTPException(status_code=404, detail="Subnet not found")
     try:
@@ -87,20 +121,24 @@ def update_subnet(
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     data = body.model_dump(exclude_unset=True)
-    for k, v in data.items():
-        setattr(subnet, k, v)
-    db.commit()
-    db.refresh(subnet)
+    if data:
+        subnet = db.execute(
+            sa_update(Subnet).where(Subnet.id == subnet_id).values(**data).returning(Subnet),
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        ).scalar_one()
+        db.commit()
+        invalidate_lists(_subnet_list_cache_keys(subnet.project_id))
     return subnet
 
 
 @router.delete("/{subnet_id}", status_code=204)
 def delete_subnet(
     subnet_id: UUID,
+    background: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    subnet = db.query(Subnet).filter(Subnet.id == subnet_id).first()
+    subnet = db.get(Subnet, subnet_id, with_for_update=True)
     if not subnet:
         raise HTTPException(status_code=404, detail="Subnet not found")
     try:
@@ -110,19 +148,25 @@ def delete_subnet(
     project_id = subnet.project_id
     cidr = subnet.cidr
     name = subnet.name
-    # Delete all hosts in this subnet first (cascades to ports, evidence, vuln instances, notes)
-    hosts_in_subnet = db.query(Host).filter(Host.subnet_id == subnet_id).all()
-    for host in hosts_in_subnet:
-        db.delete(host)
+    # One bulk DELETE for the hosts instead of hydrating each and deleting
+    # row-by-row; the ON DELETE CASCADE FKs remove ports, evidence, vuln
+    # instances and notes server-side.
+    hosts_deleted = (
+        db.query(Host)
+        .filter(Host.subnet_id == subnet_id)
+        .delete(synchronize_session=False)
+    )
     db.delete(subnet)
-    log_audit(
-        db,
+    db.commit()
+    invalidate_lists(_subnet_list_cache_keys(project_id))
+    # Audit off the critical path: the deletes are already durable.
+    background.add_task(
+        log_audit_background,
         project_id=project_id,
         user_id=current_user.id,
         action_type="delete_subnet",
         record_type="subnet",
         record_id=subnet_id,
-        after_json={"cidr": cidr, "name": name, "hosts_deleted": len(hosts_in_subnet)},
+        after_json={"cidr": cidr, "name": name, "hosts_deleted": hosts_deleted},
     )
-    db.commit()
     return None
@@ -1,21 +1,85 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import insert as sa_insert, select, update as sa_update
+from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user
 from app.db.session import get_db
 from app.models.models import Todo, Project, User, Port
 from app.schemas.todo import TodoCreate, TodoUpdate, TodoRead
+from app.services.list_cache import get_cached_list, invalidate_lists, store_list
 
 router = APIRouter()
 
+_TODO_LIST_ADAPTER = TypeAdapter(list[TodoRead])
+_TODO_READ_ADAPTER = TypeAdapter(TodoRead)
 
-def _check_project_access(db: Session, project_id: UUID, user: User) -> Project:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+# status=None and status="all" return the same rows, so they share a key.
+_TODO_LIST_VARIANTS = ("all", "open", "done")
+
+
+def _todo_list_cache_keys(project_id: UUID) -> list[str]:
+    return [f"todos:list:{project_id}:{v}" for v in _TODO_LIST_VARIANTS]
+
+
+# Exactly the columns TodoRead needs; selecting them as a Core row skips ORM
+# instrumentation per todo, which dominates list-endpoint CPU.
+_TODO_LIST_COLUMNS = (
+    Todo.id,
+    Todo.project_id,
+    Todo.title,
+    Todo.body.label("description"),
+    Todo.status,
+    Todo.subnet_id,
+    Todo.host_id,
+    Todo.port_id,
+    Todo.assigned_to_user_id,
+    User.username.label("assigned_to_username"),
+    Todo.target_type,
+    Todo.target_id,
+    Todo.created_at,
+    Todo.updated_at,
+)
+
+
+def _todo_row_to_read(row) -> TodoRead:
+    """Build TodoRead from a column-row mapping (same backfill as _todo_to_read)."""
+    tt, tid = row["target_type"], row["target_id"]
+    if tt == "scope" and (row["port_id"] or row["host_id"] or row["subnet_id"]):
+        if row["port_id"]:
+            tt, tid = "port", row["port_id"]
+        elif row["host_id"]:
+            tt, tid = "host", row["host_id"]
+        elif row["subnet_id"]:
+            tt, tid = "subnet", row["subnet_id"]
+    # model_construct skips field validation — safe for values coming
+    # straight off typed DB columns.
+    return TodoRead.model_construct(
+        id=row["id"],
+        project_id=row["project_id"],
+        title=row["title"],
+        description=row["description"],
+        status=row["status"],
+        subnet_id=row["subnet_id"],
+        host_id=row["host_id"],
+        port_id=row["port_id"],
+        assigned_to_user_id=row["assigned_to_user_id"],
+        assigned_to_username=row["assigned_to_username"],
+        target_type=tt,
+        target_id=tid,
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _check_project_access(db: Session, project_id: UUID, user: User) -> None:
+    # EXISTS returns one boolean — no row transfer or ORM hydration just to 404.
+    exists = db.query(db.query(Project.id).filter(Project.id == project_id).exists()).scalar()
+    if not exists:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
 
 
 def _todo_to_read(t: Todo) -> TodoRead:
@@ -28,7 +92,7 @@ def _todo_to_read(t: Todo) -> TodoRead:
             tt, tid = "host", t.host_id
         elif t.subnet_id:
             tt, tid = "subnet", t.subnet_id
-    return TodoRead(
+    return TodoRead.model_construct(
         id=t.id,
         project_id=t.project_id,
         title=t.title,
@@ -53,13 +117,48 @@ def list_todos(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    variant = status if status in ("open", "done") else "all"
+    cache_key = f"todos:list:{project_id}:{variant}"
+    cached = get_cached_list(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
     _check_project_access(db, project_id, current_user)
-    q = db.query(Todo).options(joinedload(Todo.assigned_to)).filter(Todo.project_id == project_id)
+    stmt = (
+        select(*_TODO_LIST_COLUMNS)
+        .outerjoin(User, Todo.assigned_to_user_id == User.id)
+        .where(Todo.project_id == project_id)
+        .order_by(Todo.created_at.desc())
+    )
     if status and status != "all":
-        q = q.filter(Todo.status == status)
-    q = q.order_by(Todo.created_at.desc())
-    todos = q.all()
-    return [_todo_to_read(t) for t in todos]
+        stmt = stmt.where(Todo.status == status)
+    rows = db.execute(stmt).mappings()
+    payload = _TODO_LIST_ADAPTER.dump_json([_todo_row_to_read(r) for r in rows])
+    store_list(cache_key, payload)
+    return Response(content=payload, media_type="application/json")
+
+
+def _port_target(db: Session, tid: UUID) -> tuple:
+    # Only host_id is needed; a column select skips hydrating a Port.
+    host_id_from_port = db.query(Port.host_id).filter(Port.id == tid).scalar()
+    return ("port", tid, None, host_id_from_port, tid)
+
+
+# target_type -> (tt, tid, subnet_id, host_id, port_id) builder; one dict
+# lookup replaces the old chain of string comparisons on every todo write.
+_TARGET_BUILDERS = {
+    "scope": lambda db, tid: ("scope", None, None, None, None),
+    "vulnerabilities": lambda db, tid: ("vulnerabilities", None, None, None, None),
+    "vulnerability_definition": lambda db, tid: ("vulnerability_definition", tid, None, None, None),
+    "subnet": lambda db, tid: ("subnet", tid, tid, None, None),
+    "host": lambda db, tid: ("host", tid, None, tid, None),
+    "host_ports": lambda db, tid: ("host_ports", tid, None, tid, None),
+    "port": _port_target,
+}
+
+# These types fall back to FK derivation when target_id is missing.
+_TARGET_NEEDS_ID = frozenset(
+    {"vulnerability_definition", "subnet", "host", "host_ports", "port"}
+)
 
 
 def _resolve_target_to_fks(
@@ -68,23 +167,9 @@ def _resolve_target_to_fks(
 ) -> tuple[str, UUID | None, UUID | None, UUID | None, UUID | None]:
     """Return (target_type, target_id, subnet_id, host_id, port_id). Uses target_* when provided else derives from FKs."""
     if target_type is not None:
-        tt, tid = target_type, target_id
-        if tt == "scope":
-            return ("scope", None, None, None, None)
-        if tt == "vulnerabilities":
-            return ("vulnerabilities", None, None, None, None)
-        if tt == "vulnerability_definition" and tid:
-            return ("vulnerability_definition", tid, None, None, None)
-        if tt == "subnet" and tid:
-            return ("subnet", tid, tid, None, None)
-        if tt == "host" and tid:
-            return ("host", tid, None, tid, None)
-        if tt == "host_ports" and tid:
-            return ("host_ports", tid, None, tid, None)
-        if tt == "port" and tid:
-            port = db.query(Port).filter(Port.id == tid).first()
-            host_id_from_port = port.host_id if port else None
-            return ("port", tid, None, host_id_from_port, tid)
+        builder = _TARGET_BUILDERS.get(target_type)
+        if builder is not None and (target_id or target_type not in _TARGET_NEEDS_ID):
+            return builder(db, target_id)
     # Backwards compat: derive target_type/target_id from FKs
     if port_id:
         return ("port", port_id, None, host_id, port_id)
@@ -107,22 +192,35 @@ def create_todo(
         body.target_type, body.target_id,
         body.subnet_id, body.host_id, body.port_id,
     )
-    todo = Todo(
-        project_id=body.project_id,
-        title=body.title,
-        body=body.description,
-        status="open",
-        target_type=tt,
-        target_id=tid,
-        subnet_id=snid,
-        host_id=hid,
-        port_id=pid,
-        assigned_to_user_id=body.assigned_to_user_id,
+    # INSERT .. RETURNING returns the row with its generated defaults in the
+    # same round trip; assigned_to resolves from the identity map (or one
+    # lazy load) only when the todo is actually assigned.
+    stmt = (
+        sa_insert(Todo)
+        .values(
+            project_id=body.project_id,
+            title=body.title,
+            body=body.description,
+            status="open",
+            target_type=tt,
+            target_id=tid,
+            subnet_id=snid,
+            host_id=hid,
+            port_id=pid,
+            assigned_to_user_id=body.assigned_to_user_id,
+        )
+        .returning(Todo)
     )
-    db.add(todo)
+    todo = db.execute(stmt).scalar_one()
     db.commit()
-    todo = db.query(Todo).options(joinedload(Todo.assigned_to)).filter(Todo.id == todo.id).first()
-    return _todo_to_read(todo)
+    invalidate_lists(_todo_list_cache_keys(body.project_id))
+    # Serialize directly; returning a Response skips FastAPI re-validating
+    # the model against response_model.
+    return Response(
+        content=_TODO_READ_ADAPTER.dump_json(_todo_to_read(todo)),
+        media_type="application/json",
+        status_code=201,
+    )
 
 
 @router.patch("/{todo_id}", response_model=TodoRead)
@@ -132,22 +230,33 @@ def update_todo(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    todo = db.query(Todo).options(joinedload(Todo.assigned_to)).filter(Todo.id == todo_id).first()
+    todo = db.get(Todo, todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
-    _check_project_access(db, todo.project_id, current_user)
+    # No project check needed: the todo exists, so its FK-backed project does too.
     data = body.model_dump(exclude_unset=True)
+    values: dict = {}
     if "status" in data:
-        todo.status = data["status"]
+        values["status"] = data["status"]
     if "title" in data:
-        todo.title = data["title"]
+        values["title"] = data["title"]
     if "description" in data:
-        todo.body = data["description"]
+        values["body"] = data["description"]
     if "assigned_to_user_id" in data:
-        todo.assigned_to_user_id = data["assigned_to_user_id"]
-    db.commit()
-    todo = db.query(Todo).options(joinedload(Todo.assigned_to)).filter(Todo.id == todo_id).first()
-    return _todo_to_read(todo)
+        values["assigned_to_user_id"] = data["assigned_to_user_id"]
+    if values:
+        # UPDATE .. RETURNING refreshes the identity-mapped row (including
+        # the onupdate timestamp) without a post-commit SELECT.
+        todo = db.execute(
+            sa_update(Todo).where(Todo.id == todo_id).values(**values).returning(Todo),
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        ).scalar_one()
+        db.commit()
+        invalidate_lists(_todo_list_cache_keys(todo.project_id))
+    return Response(
+        content=_TODO_READ_ADAPTER.dump_json(_todo_to_read(todo)),
+        media_type="application/json",
+    )
 
 
 @router.delete("/{todo_id}", status_code=204)
@@ -156,10 +265,11 @@ def delete_todo(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    todo = db.query(Todo).filter(Todo.id == todo_id).first()
+    todo = db.get(Todo, todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
-    _check_project_access(db, todo.project_id, current_user)
+    project_id = todo.project_id
     db.delete(todo)
     db.commit()
+    invalidate_lists(_todo_list_cache_keys(project_id))
     return None
@@ -1,15 +1,13 @@
 from uuid import UUID
 import os
-import uuid as uuid_mod
-import shutil
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, UploadFile, File
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from fastapi import status
 
 from app.core.deps import get_current_user
-from app.core.config import settings
 from app.db.session import get_db
 from app.models.models import (
     VulnerabilityDefinition,
@@ -29,6 +27,7 @@ from app.schemas.vulnerability_definition import (
     AffectedSubnetsUpdate,
 )
 from app.schemas.vulnerability_attachment import VulnerabilityAttachmentRead
+from app.services.blob_store import ext_for, remove_blob_if_unused_background, store_blob
 from app.services.lock import require_lock
 from app.services.vuln_affected import get_affected_host_ids
 from app.services.audit import log_audit
@@ -38,13 +37,9 @@ router = APIRouter()
 
 def _vuln_def_to_response(db: Session, d: VulnerabilityDefinition) -> VulnerabilityDefinitionWithInstances:
     affected = get_affected_host_ids(db, d)
-    subnet_ids = [
-        a.subnet_id
-        for a in db.query(VulnerabilitySubnetAssociation)
-        .filter(VulnerabilitySubnetAssociation.vulnerability_definition_id == d.id)
-        .all()
-    ]
-    instances = db.query(VulnerabilityInstance).filter(VulnerabilityInstance.vulnerability_definition_id == d.id).all()
+    # Both collections are selectin-loaded, so listing N definitions batches
+    # these into one query per relationship instead of two per definition.
+    subnet_ids = [a.subnet_id for a in d.subnet_associations]
     return VulnerabilityDefinitionWithInstances(
         id=d.id,
         project_id=d.project_id,
@@ -57,7 +52,7 @@ def _vuln_def_to_response(db: Session, d: VulnerabilityDefinition) -> Vulnerabil
         discovered_by=d.discovered_by,
         created_at=d.created_at,
         updated_at=d.updated_at,
-        instance_count=len(instances),
+        instance_count=len(d.instances),
         affected_host_ids=affected,
         affected_subnet_ids=subnet_ids,
     )
@@ -66,10 +61,15 @@ def _vuln_def_to_response(db: Session, d: VulnerabilityDefinition) -> Vulnerabil
 @router.get("", response_model=list[VulnerabilityDefinitionWithInstances])
 def list_vulnerability_definitions(
     project_id: UUID = Query(...),
+    search: str | None = Query(None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     q = db.query(VulnerabilityDefinition).filter(VulnerabilityDefinition.project_id == project_id)
+    if search:
+        q = q.filter(
+            VulnerabilityDefinition.search_tsv.op("@@")(func.plainto_tsquery("english", search))
+        )
     defs = q.order_by(VulnerabilityDefinition.created_at.desc()).all()
     return [_vuln_def_to_response(db, d) for d in defs]
 
@@ -257,7 +257,7 @@ def list_vulnerability_attachments(
     if not defn:
         raise HTTPException(status_code=404, detail="Vulnerability not found")
     atts = db.query(VulnerabilityAttachment).options(
-        joinedload(VulnerabilityAttachment.uploaded_by)
+        joinedload(VulnerabilityAttachment.uploaded_by), raiseload("*")
     ).filter(VulnerabilityAttachment.vulnerability_definition_id == def_id).order_by(
         VulnerabilityAttachment.created_at.asc()
     ).all()
@@ -290,14 +290,7 @@ def upload_vulnerability_attachment(
         require_lock(db, defn.project_id, "vulnerability_definition", def_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-    base = os.path.join(settings.attachments_dir, "vuln_def", str(def_id))
-    os.makedirs(base, exist_ok=True)
-    ext = os.path.splitext(file.filename or "file")[1] or ""
-    fname = f"{uuid_mod.uuid4().hex}{ext}"
-    path = os.path.join(base, fname)
-    with open(path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    size = os.path.getsize(path)
+    path, size, _digest = store_blob(file.file, ext_for(file.filename or "file"))
     att = VulnerabilityAttachment(
         vulnerability_definition_id=def_id,
         filename=file.filename or "uploaded",
@@ -342,14 +335,7 @@ def paste_vulnerability_screenshot(
         require_lock(db, defn.project_id, "vulnerability_definition", def_id, current_user)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-    base = os.path.join(settings.attachments_dir, "vuln_def", str(def_id))
-    os.makedirs(base, exist_ok=True)
-    ext = ".png"
-    fname = f"{uuid_mod.uuid4().hex}{ext}"
-    path = os.path.join(base, fname)
-    with open(path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    size = os.path.getsize(path)
+    path, size, _digest = store_blob(file.file, ".png")
     att = VulnerabilityAttachment(
         vulnerability_definition_id=def_id,
         filename="Pasted Screenshot",
@@ -399,6 +385,7 @@ def get_vulnerability_attachment_file(
 def delete_vulnerability_attachment(
     def_id: UUID,
     att_id: UUID,
+    background: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -415,10 +402,14 @@ def delete_vulnerability_attachment(
     ).first()
     if not att:
         raise HTTPException(status_code=404, detail="Attachment not found")
-    if os.path.isfile(att.stored_path):
-        os.remove(att.stored_path)
+    # Blobs are content-addressed and may back several rows; only unlink the
+    # file when no other evidence or attachment still references it, and only
+    # once the row deletion has committed so a failed commit never leaves a
+    # row pointing at a missing file.
+    stored_path = att.stored_path
     db.delete(att)
     db.commit()
+    background.add_task(remove_blob_if_unused_background, stored_path)
     return None
 
 
@@ -2,7 +2,7 @@ from uuid import UUID
 import hashlib
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.core.deps import get_current_user
 from app.db.session import get_db
@@ -44,8 +44,11 @@ def list_vulnerability_instances(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # raiseload pins the query to the preloaded definition: touching any
+    # other relationship while serializing raises instead of issuing a
+    # SELECT per row.
     q = db.query(VulnerabilityInstance).options(
-        joinedload(VulnerabilityInstance.definition)
+        joinedload(VulnerabilityInstance.definition), raiseload("*")
     )
     if project_id is not None:
         q = q.filter(VulnerabilityInstance.project_id == project_id)
@@ -7,8 +7,9 @@ from app.models.models import User
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Require the current user to have admin role."""
-    role = current_user.role.value if hasattr(current_user.role, "value") else str(current_user.role)
-    if role != "admin":
+    # role is a string-valued SQLEnum, so the ORM hands back plain str; a
+    # single equality check replaces the hasattr/.value indirection.
+    if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
@@ -1,15 +1,14 @@
-import logging
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyCookie
 from sqlalchemy.orm import Session
 
 from app.core.security import TOKEN_COOKIE_NAME, decode_access_token
 from app.db.session import get_db
-from app.models.models import User
+from app.models.models import Project, User
+from app.services.user_cache import get_cached_user, store_user, user_from_cached
 
-logger = logging.getLogger(__name__)
 cookie_scheme = APIKeyCookie(name=TOKEN_COOKIE_NAME, auto_error=False)
 
 
@@ -17,7 +16,6 @@ def get_current_user(
     db: Session = Depends(get_db),
     token: str | None = Depends(cookie_scheme),
 ) -> User:
-    logger.info("auth check: cookie_%s=%s", TOKEN_COOKIE_NAME, "present" if token else "absent")
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -42,7 +40,16 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         )
-    user = db.query(User).filter(User.id == user_id).first()
+    # Short-TTL cache removes the per-request user SELECT; merge(load=False)
+    # attaches the cached row to this session so writes through it (e.g.
+    # change-password) still flush normally.
+    cached = get_cached_user(user_id)
+    if cached is not None:
+        user = db.merge(user_from_cached(cached), load=False)
+    else:
+        user = db.get(User, user_id)
+        if user:
+            store_user(user)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,3 +61,25 @@ def get_current_user(
             detail="Account disabled",
         )
     return user
+
+
+def get_project_or_404(
+    project_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Project:
+    """Load the project or raise 404, caching the row on request.state.
+
+    Handlers and sub-dependencies that both need the Project share one
+    SELECT per request instead of re-fetching the same row.
+    """
+    cache = getattr(request.state, "projects", None)
+    if cache is None:
+        cache = request.state.projects = {}
+    project = cache.get(project_id)
+    if project is None:
+        project = db.get(Project, project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        cache[project_id] = project
+    return project
@@ -1,3 +1,6 @@
+import hashlib
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
@@ -8,6 +11,26 @@ from app.core.config import settings
 
 TOKEN_COOKIE_NAME = "redopsync_session"
 
+# Bound once at import: these are read on every token encode/decode and
+# pydantic attribute resolution isn't free on a per-request hot path.
+_SECRET_KEY = settings.secret_key
+_SECRET_KEY_BYTES = settings.secret_key.encode("utf-8")
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+# A dedicated PyJWT instance with its options resolved up front; the
+# module-level jwt.decode helper rebuilds the options dict per call.
+_JWT = jwt.PyJWT(options={"require": ["exp", "sub"]})
+
+# Every authenticated request goes through decode_access_token, so cache
+# decoded payloads in-process: a repeat request with the same cookie costs a
+# dict lookup instead of an HMAC verify + JSON parse. Entries are keyed by a
+# token digest (not the raw JWT) and expire with the token itself; invalid
+# tokens are cached as None for a short window.
+_TOKEN_CACHE_MAX = 4096
+_TOKEN_NEGATIVE_TTL_SECONDS = 10.0
+_token_cache: dict[bytes, tuple[float, dict | None]] = {}
+_token_cache_lock = threading.Lock()
+
 # bcrypt has a 72-byte limit; longer passwords are rejected to avoid silent truncation
 BCRYPT_MAX_PASSWORD_BYTES = 72
 
@@ -16,7 +39,9 @@ def hash_password(password: str) -> str:
     encoded = password.encode("utf-8")
     if len(encoded) > BCRYPT_MAX_PASSWORD_BYTES:
         raise ValueError("Password is too long (max 72 bytes).")
-    return bcrypt.hashpw(encoded, bcrypt.gensalt()).decode("ascii")
+    # Work factor is tunable so deployments can trade login latency against
+    # hash strength without a code change; the floor stays at a safe cost.
+    return bcrypt.hashpw(encoded, bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("ascii")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -38,17 +63,32 @@ def create_access_token(user_id: UUID, username: str, role: str) -> str:
     }
     return jwt.encode(
         payload,
-        settings.secret_key,
-        algorithm=settings.jwt_algorithm,
+        _SECRET_KEY,
+        algorithm=_JWT_ALGORITHM,
     )
 
 
 def decode_access_token(token: str) -> dict | None:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1]
     try:
-        return jwt.decode(
+        payload = _JWT.decode(
             token,
-            settings.secret_key,
-            algorithms=[settings.jwt_algorithm],
+            _SECRET_KEY_BYTES,
+            algorithms=_JWT_ALGORITHMS,
         )
+        expires_at = float(payload.get("exp", now))
     except jwt.PyJWTError:
-        return None
+        payload = None
+        expires_at = now + _TOKEN_NEGATIVE_TTL_SECONDS
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            # Bounded cache: dropping everything is fine, entries rebuild on
+            # the next request and stale ones never outlive their token.
+            _token_cache.clear()
+        _token_cache[key] = (expires_at, payload)
+    return payload
@@ -1,8 +1,10 @@
 """WebSocket connection manager for broadcasting lock and job events."""
 import asyncio
-import json
+from collections import defaultdict
 from uuid import UUID
 
+import orjson
+
 from fastapi import WebSocket
 
 
@@ -12,12 +14,15 @@ class ConnectionManager:
     def __init__(self) -> None:
         # project_id -> set of WebSocket connections
         self._project_connections: dict[str, set[WebSocket]] = {}
-        self._lock = asyncio.Lock()
+        # One lock per project so churn on one project's subscribers never
+        # serializes against another's; the dict stays small (one entry per
+        # project ever subscribed to).
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     async def subscribe(self, ws: WebSocket, project_id: UUID) -> None:
         """Register a connection as subscribed to a project."""
         key = str(project_id)
-        async with self._lock:
+        async with self._locks[key]:
             if key not in self._project_connections:
                 self._project_connections[key] = set()
             self._project_connections[key].add(ws)
@@ -25,7 +30,7 @@ class ConnectionManager:
     async def unsubscribe(self, ws: WebSocket, project_id: UUID) -> None:
         """Remove a connection from a project's subscribers."""
         key = str(project_id)
-        async with self._lock:
+        async with self._locks[key]:
             if key in self._project_connections:
                 self._project_connections[key].discard(ws)
                 if not self._project_connections[key]:
@@ -39,17 +44,23 @@ class ConnectionManager:
     ) -> None:
         """Broadcast lock_changed (or lock_released) to all project subscribers."""
         key = str(project_id)
-        async with self._lock:
-            connections = self._project_connections.get(key, set()).copy()
-        msg = json.dumps({"type": "lock_changed", "event": event, "data": payload})
-        dead: list[WebSocket] = []
-        for ws in connections:
-            try:
-                await ws.send_text(msg)
-            except Exception:
-                dead.append(ws)
+        # Snapshot without locking: there is no await between the read and
+        # the copy, so no other task can mutate the set mid-iteration.
+        connections = tuple(self._project_connections.get(key, ()))
+        if not connections:
+            return
+        # orjson handles UUID/datetime natively; decode once so the frame
+        # stays text for the browser client.
+        msg = orjson.dumps({"type": "lock_changed", "event": event, "data": payload}).decode()
+        # Fan out concurrently so one slow client delays only its own send,
+        # not everyone behind it in a serial loop. Text frames are kept: the
+        # web client JSON.parses ev.data and binary frames arrive as Blobs.
+        results = await asyncio.gather(
+            *(ws.send_text(msg) for ws in connections), return_exceptions=True
+        )
+        dead = [ws for ws, res in zip(connections, results) if isinstance(res, BaseException)]
         if dead:
-            async with self._lock:
+            async with self._locks[key]:
                 for ws in dead:
                     if key in self._project_connections:
                         self._project_connections[key].discard(ws)
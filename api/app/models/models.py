@@ -1,76 +1,136 @@
+import os
+import time
 import uuid
-from datetime import datetime
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     String,
     Text,
     Integer,
+    SmallInteger,
     DateTime,
+    FetchedValue,
     ForeignKey,
     Enum as SQLEnum,
+    Index,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY, TSVECTOR
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
 
 
+def uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: 48-bit unix-ms timestamp followed by random bits.
+
+    Time-ordered keys cluster inserts at the right edge of the B-tree,
+    avoiding the page splits and random I/O that v4 keys cause on
+    insert-heavy tables.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (ts_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0x2 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 def uuid_default():
-    return uuid.uuid4()
+    return uuid7()
+
+
+# Server-side twin of uuid7() (created in migration 031) so bulk SQL inserts
+# that bypass the ORM get time-ordered ids too.
+_UUID7_SERVER_DEFAULT = text("gen_uuid_v7()")
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     username = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     role = Column(SQLEnum("user", "admin", name="user_role"), nullable=False, default="user")
     must_change_password = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     disabled_at = Column(DateTime(timezone=True), nullable=True)
 
+    # passive_deletes throughout: the ON DELETE clauses on the foreign keys
+    # handle removal/detachment server-side.
+    vulnerability_attachments = relationship(
+        "VulnerabilityAttachment", back_populates="uploaded_by", passive_deletes=True
+    )
+    evidence = relationship("Evidence", back_populates="uploaded_by", passive_deletes=True)
+    saved_reports = relationship("SavedReport", back_populates="created_by", passive_deletes=True)
+    locks = relationship("Lock", back_populates="locked_by", passive_deletes=True)
+
 
 class Project(Base):
     __tablename__ = "projects"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     start_date = Column(DateTime(timezone=True), nullable=True)
     end_date = Column(DateTime(timezone=True), nullable=True)
-    countdown_red_days_default = Column(Integer, nullable=False, default=7)
+    countdown_red_days_default = Column(SmallInteger, nullable=False, default=7)
     scope_policy = Column(JSONB, nullable=True)
     sort_mode = Column(String(32), nullable=False, default="cidr_asc")
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # passive_deletes: project deletion is one DELETE statement; the
+    # ON DELETE CASCADE foreign keys clean up children server-side instead
+    # of the ORM loading and deleting them row-by-row.
+    subnets = relationship("Subnet", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    hosts = relationship("Host", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    todos = relationship("Todo", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    saved_reports = relationship("SavedReport", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    tags = relationship("Tag", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    locks = relationship("Lock", back_populates="project", passive_deletes=True)
 
-    subnets = relationship("Subnet", back_populates="project", cascade="all, delete-orphan")
-    hosts = relationship("Host", back_populates="project", cascade="all, delete-orphan")
-    todos = relationship("Todo", back_populates="project", cascade="all, delete-orphan")
-    saved_reports = relationship("SavedReport", back_populates="project", cascade="all, delete-orphan")
-    tags = relationship("Tag", back_populates="project", cascade="all, delete-orphan")
+    __table_args__ = (
+        # jsonb_path_ops GIN: half the size of jsonb_ops and faster for the
+        # @> containment filters these columns are queried with.
+        Index(
+            "idx_projects_scope_policy_gin",
+            "scope_policy",
+            postgresql_using="gin",
+            postgresql_ops={"scope_policy": "jsonb_path_ops"},
+        ),
+    )
 
 
 class Subnet(Base):
     __tablename__ = "subnets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     cidr = Column(String(64), nullable=False)
     name = Column(String(255), nullable=True)
     in_scope = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     project = relationship("Project", back_populates="subnets")
     hosts = relationship("Host", back_populates="subnet", cascade="all, delete-orphan")
+    vulnerability_associations = relationship(
+        "VulnerabilitySubnetAssociation", back_populates="subnet", passive_deletes=True
+    )
+    todos = relationship("Todo", back_populates="subnet", passive_deletes=True)
 
 
 class Host(Base):
     __tablename__ = "hosts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     subnet_id = Column(UUID(as_uuid=True), ForeignKey("subnets.id", ondelete="SET NULL"), nullable=True, index=True)
     ip = Column(String(45), nullable=False)
@@ -79,21 +139,32 @@ class Host(Base):
     status = Column(String(64), nullable=True, default="unknown")
     whois_data = Column(JSONB, nullable=True)
     in_scope = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
     project = relationship("Project", back_populates="hosts")
     subnet = relationship("Subnet", back_populates="hosts")
     ports = relationship("Port", back_populates="host", cascade="all, delete-orphan")
+    vulnerability_instances = relationship(
+        "VulnerabilityInstance", back_populates="host", passive_deletes=True
+    )
+    todos = relationship("Todo", back_populates="host", passive_deletes=True)
+
+    __table_args__ = (
+        # GIN serves tags @> ARRAY[...] containment from the inverted index
+        # instead of scanning every host.
+        Index("idx_hosts_tags_gin", "tags", postgresql_using="gin"),
+    )
 
 
 class Port(Base):
     __tablename__ = "ports"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
-    host_id = Column(UUID(as_uuid=True), ForeignKey("hosts.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
+    # Covered by the unique index behind uq_host_protocol_number below.
+    host_id = Column(UUID(as_uuid=True), ForeignKey("hosts.id", ondelete="CASCADE"), nullable=False)
     protocol = Column(SQLEnum("tcp", "udp", name="port_protocol"), nullable=False)
-    number = Column(Integer, nullable=False)
+    number = Column(Integer, nullable=False)  # 1-65535 overflows signed smallint; keep integer
     state = Column(String(32), nullable=True)
     service_name = Column(String(255), nullable=True)
     service_version = Column(String(255), nullable=True)
@@ -103,10 +174,11 @@ class Port(Base):
     discovered_by = Column(String(64), nullable=True)
     scanned_at = Column(DateTime(timezone=True), nullable=True)
     scan_metadata = Column(JSONB, nullable=True)  # e.g. state_reason, service_conf, devicetype, nmap_args, scan_start, scan_end
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
     host = relationship("Host", back_populates="ports")
+    todos = relationship("Todo", back_populates="port", passive_deletes=True)
 
     __table_args__ = (
         UniqueConstraint("host_id", "protocol", "number", name="uq_host_protocol_number"),
@@ -116,27 +188,36 @@ class Port(Base):
 class Application(Base):
     __tablename__ = "applications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     host_id = Column(UUID(as_uuid=True), ForeignKey("hosts.id", ondelete="CASCADE"), nullable=False, index=True)
     port_id = Column(UUID(as_uuid=True), ForeignKey("ports.id", ondelete="SET NULL"), nullable=True, index=True)
     type = Column(String(64), nullable=True)
     url = Column(Text, nullable=True)
     metadata_ = Column("metadata", JSONB, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "idx_applications_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
 
 
 class VulnerabilitySubnetAssociation(Base):
     __tablename__ = "vulnerability_subnet_associations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     vulnerability_definition_id = Column(
         UUID(as_uuid=True), ForeignKey("vulnerability_definitions.id", ondelete="CASCADE"), nullable=False, index=True
     )
     subnet_id = Column(UUID(as_uuid=True), ForeignKey("subnets.id", ondelete="CASCADE"), nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
-    definition = relationship("VulnerabilityDefinition", backref="subnet_associations")
-    subnet = relationship("Subnet", backref="vulnerability_associations")
+    definition = relationship("VulnerabilityDefinition", back_populates="subnet_associations")
+    subnet = relationship("Subnet", back_populates="vulnerability_associations")
 
     __table_args__ = (UniqueConstraint("vulnerability_definition_id", "subnet_id", name="uq_vuln_def_subnet"),)
 
@@ -144,7 +225,7 @@ class VulnerabilitySubnetAssociation(Base):
 class VulnerabilityAttachment(Base):
     __tablename__ = "vulnerability_attachments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     vulnerability_definition_id = Column(
         UUID(as_uuid=True), ForeignKey("vulnerability_definitions.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -154,16 +235,16 @@ class VulnerabilityAttachment(Base):
     stored_path = Column(String(1024), nullable=False)
     uploaded_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     is_pasted = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
-    definition = relationship("VulnerabilityDefinition", backref="attachments")
-    uploaded_by = relationship("User", backref="vulnerability_attachments")
+    definition = relationship("VulnerabilityDefinition", back_populates="attachments")
+    uploaded_by = relationship("User", back_populates="vulnerability_attachments")
 
 
 class VulnerabilityDefinition(Base):
     __tablename__ = "vulnerability_definitions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String(512), nullable=False)
     description_md = Column(Text, nullable=True)
@@ -175,15 +256,49 @@ class VulnerabilityDefinition(Base):
     cve_ids = Column(ARRAY(String), nullable=True, default=list)
     references = Column(ARRAY(Text), nullable=True, default=list)
     discovered_by = Column(String(64), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    # Server-generated; searched with @@ through the GIN index below instead
+    # of ILIKE sequential scans.
+    search_tsv = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description_md, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+
+    # selectin: definitions are almost always serialized with their instance
+    # counts and affected subnets, so batch-load the collections with one
+    # WHERE ... IN (...) query each instead of one query per definition.
+    # passive_deletes: the ON DELETE CASCADE foreign keys remove children.
+    instances = relationship(
+        "VulnerabilityInstance", back_populates="definition", lazy="selectin", passive_deletes=True
+    )
+    attachments = relationship(
+        "VulnerabilityAttachment", back_populates="definition", lazy="selectin", passive_deletes=True
+    )
+    subnet_associations = relationship(
+        "VulnerabilitySubnetAssociation",
+        back_populates="definition",
+        lazy="selectin",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("idx_vuln_defs_cve_ids_gin", "cve_ids", postgresql_using="gin"),
+        Index("idx_vuln_defs_references_gin", "references", postgresql_using="gin"),
+        Index("idx_vuln_defs_search_tsv_gin", "search_tsv", postgresql_using="gin"),
+    )
 
 
 class VulnerabilityInstance(Base):
     __tablename__ = "vulnerability_instances"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
+    # Covered by idx_vuln_instances_project_status_created below.
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     vulnerability_definition_id = Column(
         UUID(as_uuid=True), ForeignKey("vulnerability_definitions.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -193,18 +308,28 @@ class VulnerabilityInstance(Base):
         SQLEnum("open", "accepted_risk", "closed", name="vuln_instance_status"), nullable=False, default="open"
     )
     notes_md = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
-    definition = relationship("VulnerabilityDefinition", backref="instances")
-    host = relationship("Host", backref="vulnerability_instances")
+    definition = relationship("VulnerabilityDefinition", back_populates="instances")
+    host = relationship("Host", back_populates="vulnerability_instances")
+
+    __table_args__ = (
+        Index(
+            "idx_vuln_instances_project_status_created",
+            "project_id",
+            "status",
+            text("created_at DESC"),
+        ),
+    )
 
 
 class Evidence(Base):
     __tablename__ = "evidence"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
+    # Covered by idx_evidence_project_created below.
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     host_id = Column(UUID(as_uuid=True), ForeignKey("hosts.id", ondelete="CASCADE"), nullable=True, index=True)
     port_id = Column(UUID(as_uuid=True), ForeignKey("ports.id", ondelete="SET NULL"), nullable=True, index=True)
     vuln_instance_id = Column(
@@ -213,7 +338,7 @@ class Evidence(Base):
     filename = Column(String(512), nullable=False)
     mime = Column(String(128), nullable=True)
     size = Column(Integer, nullable=True)
-    sha256 = Column(String(64), nullable=True)
+    sha256 = Column(String(64), nullable=True, index=True)
     caption = Column(Text, nullable=True)
     stored_path = Column(String(1024), nullable=True)
     is_pasted = Column(Boolean, nullable=False, default=False)
@@ -223,20 +348,42 @@ class Evidence(Base):
     source_timestamp = Column(String(128), nullable=True)  # raw timestamp from tool (e.g. gowitness probed_at)
     notes_md = Column(Text, nullable=True)  # user-added notes for this evidence
     created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    # Denormalized from users.username by triggers (filled on insert, synced
+    # on rename); every evidence read needs it, and the column keeps list
+    # queries single-table instead of joining users per row.
+    uploaded_by_username = Column(String(255), nullable=True, server_default=FetchedValue())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     thumbnail_path = Column(String(1024), nullable=True)
     parent_evidence_id = Column(
         UUID(as_uuid=True), ForeignKey("evidence.id", ondelete="CASCADE"), nullable=True, index=True
     )
 
-    uploaded_by = relationship("User", backref="evidence")
+    uploaded_by = relationship("User", back_populates="evidence")
+
+    __table_args__ = (
+        # Matches the "by project, newest first" listing; INCLUDE lets the
+        # common file-listing projection come straight off the index.
+        Index(
+            "idx_evidence_project_created",
+            "project_id",
+            text("created_at DESC"),
+            postgresql_include=["filename", "mime", "size"],
+        ),
+        Index(
+            "idx_evidence_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class Note(Base):
     __tablename__ = "notes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
+    # Covered by idx_notes_project_created below.
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     target_type = Column(String(32), nullable=False, default="scope")
     target_id = Column(UUID(as_uuid=True), nullable=True)
     subnet_id = Column(UUID(as_uuid=True), ForeignKey("subnets.id", ondelete="CASCADE"), nullable=True, index=True)
@@ -248,14 +395,24 @@ class Note(Base):
     )
     body_md = Column(Text, nullable=True)
     created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    search_tsv = Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(body_md, ''))", persisted=True),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        Index("idx_notes_project_created", "project_id", text("created_at DESC")),
+        Index("idx_notes_search_tsv_gin", "search_tsv", postgresql_using="gin"),
+    )
 
 
 class Todo(Base):
     __tablename__ = "todos"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     target_type = Column(String(32), nullable=False, default="scope")
     target_id = Column(UUID(as_uuid=True), nullable=True)
@@ -263,26 +420,26 @@ class Todo(Base):
     body = Column(Text, nullable=True)
     assigned_to_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
     completion_notes = Column(Text, nullable=True)
     status = Column(String(16), nullable=False, default="open")
     subnet_id = Column(UUID(as_uuid=True), ForeignKey("subnets.id", ondelete="SET NULL"), nullable=True, index=True)
     host_id = Column(UUID(as_uuid=True), ForeignKey("hosts.id", ondelete="SET NULL"), nullable=True, index=True)
     port_id = Column(UUID(as_uuid=True), ForeignKey("ports.id", ondelete="SET NULL"), nullable=True, index=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
     project = relationship("Project", back_populates="todos")
-    subnet = relationship("Subnet", backref="todos")
-    host = relationship("Host", backref="todos")
-    port = relationship("Port", backref="todos")
+    subnet = relationship("Subnet", back_populates="todos")
+    host = relationship("Host", back_populates="todos")
+    port = relationship("Port", back_populates="todos")
     assigned_to = relationship("User", foreign_keys=[assigned_to_user_id])
 
 
 class SavedReport(Base):
     __tablename__ = "saved_reports"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -291,17 +448,17 @@ class SavedReport(Base):
     filter_expression = Column(Text, nullable=True)
     definition_json = Column(JSONB, nullable=True)
     created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=True, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=True, server_onupdate=FetchedValue())
 
     project = relationship("Project", back_populates="saved_reports")
-    created_by = relationship("User", backref="saved_reports")
+    created_by = relationship("User", back_populates="saved_reports")
 
 
 class Tag(Base):
     __tablename__ = "tags"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(128), nullable=False)
     color = Column(String(32), nullable=True)
@@ -313,7 +470,7 @@ class Tag(Base):
 class ItemTag(Base):
     __tablename__ = "item_tags"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.id", ondelete="CASCADE"), nullable=False, index=True)
     target_type = Column(String(32), nullable=False)
     target_id = Column(UUID(as_uuid=True), nullable=False)
@@ -326,44 +483,83 @@ class ItemTag(Base):
 class Lock(Base):
     __tablename__ = "locks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
-    project = relationship("Project", backref="locks", passive_deletes=True)
+    project = relationship("Project", back_populates="locks")
     record_type = Column(String(64), nullable=False)
     record_id = Column(UUID(as_uuid=True), nullable=False)
     locked_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    locked_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=False)
 
-    locked_by = relationship("User", backref="locks")
+    locked_by = relationship("User", back_populates="locks")
+
+    __table_args__ = (
+        # One lock row per record: the lock-check on every edit becomes a
+        # unique-index probe, and a concurrent double-acquire fails at the
+        # database instead of racing. Postgres rejects a partial predicate on
+        # now() (not IMMUTABLE), so expired rows are purged by the service
+        # layer rather than excluded here.
+        Index("idx_locks_record", "record_type", "record_id", unique=True),
+    )
 
 
 class AuditEvent(Base):
     __tablename__ = "audit_events"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
+    # Covered by idx_audit_project_created below.
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     action_type = Column(String(64), nullable=False)
     record_type = Column(String(64), nullable=True)
     record_id = Column(UUID(as_uuid=True), nullable=True)
     before_json = Column(JSONB, nullable=True)
     after_json = Column(JSONB, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    # Part of the primary key: the table is range-partitioned by month on
+    # created_at and Postgres requires the partition key in the PK.
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), primary_key=True
+    )
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "idx_audit_before_json_gin",
+            "before_json",
+            postgresql_using="gin",
+            postgresql_ops={"before_json": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_audit_after_json_gin",
+            "after_json",
+            postgresql_using="gin",
+            postgresql_ops={"after_json": "jsonb_path_ops"},
+        ),
+        Index("idx_audit_project_created", "project_id", text("created_at DESC")),
+        # Append-only table: BRIN is a tiny fraction of a B-tree's size and
+        # serves global time-range scans because rows land in created_at order.
+        Index(
+            "idx_audit_events_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
 
 class ImportExportJob(Base):
     __tablename__ = "import_export_jobs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     type = Column(String(32), nullable=False)  # import | export
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True, index=True)
     filename = Column(String(512), nullable=True)
     status = Column(String(32), nullable=False, default="pending")  # pending, in_progress, completed, failed
     created_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
 
@@ -371,26 +567,64 @@ class ImportExportJob(Base):
 class Session(Base):
     __tablename__ = "sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     ip_address = Column(String(45), nullable=True)
-    last_activity = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    last_activity = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "idx_sessions_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class Job(Base):
     __tablename__ = "jobs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_default, server_default=_UUID7_SERVER_DEFAULT)
+    # Covered by idx_jobs_project_status_created below.
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     type = Column(String(64), nullable=False)
     target_ref = Column(JSONB, nullable=True)
     status = Column(String(32), nullable=False, default="pending")
     requested_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     parameters = Column(JSONB, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     started_at = Column(DateTime(timezone=True), nullable=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
     logs_text = Column(Text, nullable=True)
     raw_artifact_paths = Column(ARRAY(Text), nullable=True, default=list)
     error_text = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_jobs_target_ref_gin",
+            "target_ref",
+            postgresql_using="gin",
+            postgresql_ops={"target_ref": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_jobs_parameters_gin",
+            "parameters",
+            postgresql_using="gin",
+            postgresql_ops={"parameters": "jsonb_path_ops"},
+        ),
+        Index("idx_jobs_raw_artifact_paths_gin", "raw_artifact_paths", postgresql_using="gin"),
+        Index(
+            "idx_jobs_project_status_created",
+            "project_id",
+            "status",
+            text("created_at DESC"),
+        ),
+        Index(
+            "idx_jobs_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
@@ -1,5 +1,6 @@
 """Admin user management schemas."""
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -18,7 +19,7 @@ class AdminUserRead(BaseModel):
 class AdminUserCreate(BaseModel):
     username: str = Field(..., min_length=1, max_length=255)
     password: str = Field(..., min_length=8)
-    role: str = Field(..., pattern="^(admin|operator)$")
+    role: Literal["admin", "operator"]
 
 
 class AdminUserResetPassword(BaseModel):
@@ -28,4 +29,4 @@ class AdminUserResetPassword(BaseModel):
 class AdminUserUpdate(BaseModel):
     username: str | None = Field(None, min_length=1, max_length=255)
     password: str | None = Field(None, min_length=8)
-    role: str | None = Field(None, pattern="^(admin|operator)$")
+    role: Literal["admin", "operator"] | None = None
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -6,7 +7,9 @@ from pydantic import BaseModel, Field
 
 class LockCreate(BaseModel):
     project_id: UUID
-    record_type: str = Field(..., pattern="^(host|port|subnet|note|vulnerability_instance|vulnerability_definition)$")
+    record_type: Literal[
+        "host", "port", "subnet", "note", "vulnerability_instance", "vulnerability_definition"
+    ]
     record_id: UUID
 
 
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -12,9 +13,10 @@ class NoteCreate(BaseModel):
     evidence_id: UUID | None = None
     vuln_instance_id: UUID | None = None
     body_md: str | None = None
-    target_type: str | None = Field(
-        None, pattern="^(scope|subnet|host|host_ports|port|evidence|vulnerabilities|vulnerability_definition)$"
-    )
+    target_type: Literal[
+        "scope", "subnet", "host", "host_ports", "port", "evidence",
+        "vulnerabilities", "vulnerability_definition",
+    ] | None = None
     target_id: UUID | None = None
 
 
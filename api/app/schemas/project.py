@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -16,9 +16,12 @@ class ProjectCreate(BaseModel):
 
 SORT_MODE_VALUES = ("cidr_asc", "cidr_desc", "alpha_asc", "alpha_desc", "last_seen_desc")
 
+# Literal validates as a set lookup in pydantic-core instead of a regex run.
+SortModeLiteral = Literal["cidr_asc", "cidr_desc", "alpha_asc", "alpha_desc", "last_seen_desc"]
+
 
 class ProjectSortModeUpdate(BaseModel):
-    sort_mode: str = Field(..., pattern="^(cidr_asc|cidr_desc|alpha_asc|alpha_desc|last_seen_desc)$")
+    sort_mode: SortModeLiteral
 
 
 class ProjectUpdate(BaseModel):
@@ -28,7 +31,7 @@ class ProjectUpdate(BaseModel):
     end_date: datetime | None = None
     countdown_red_days_default: int | None = Field(None, ge=1, le=365)
     scope_policy: dict[str, Any] | None = None
-    sort_mode: str | None = Field(None, pattern="^(cidr_asc|cidr_desc|alpha_asc|alpha_desc|last_seen_desc)$")
+    sort_mode: SortModeLiteral | None = None
 
 
 class ImportFromPathBody(BaseModel):
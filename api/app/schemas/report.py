@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -172,7 +173,7 @@ class ReportCondition(BaseModel):
 
 class ReportGroup(BaseModel):
     """Nested group: AND or OR over children (groups or conditions)."""
-    op: str = Field(..., pattern="^(AND|OR)$")
+    op: Literal["AND", "OR"]
     children: list[ReportGroup | ReportCondition] = Field(default_factory=list)
 
 
@@ -185,7 +186,7 @@ class ReportColumnSpec(BaseModel):
 class ReportSortItem(BaseModel):
     """Sort by key and direction."""
     key: str
-    direction: str = Field(..., pattern="^(asc|desc)$")
+    direction: Literal["asc", "desc"]
 
 
 class ReportDefinitionV2(BaseModel):
@@ -1,3 +1,4 @@
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -24,14 +25,14 @@ class TagRead(BaseModel):
 
 class ItemTagCreate(BaseModel):
     tag_id: UUID
-    target_type: str = Field(..., pattern="^(host|port|port_evidence|vuln_definition)$")
+    target_type: Literal["host", "port", "port_evidence", "vuln_definition"]
     target_id: UUID
 
 
 class ItemTagAssignment(BaseModel):
     """One target for bulk tag assignment."""
 
-    target_type: str = Field(..., pattern="^(host|port|port_evidence|vuln_definition)$")
+    target_type: Literal["host", "port", "port_evidence", "vuln_definition"]
     target_id: UUID
 
 
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -12,14 +13,17 @@ class TodoCreate(BaseModel):
     host_id: UUID | None = None
     port_id: UUID | None = None
     assigned_to_user_id: UUID | None = None
-    target_type: str | None = Field(None, pattern="^(scope|subnet|host|host_ports|port|vulnerabilities|vulnerability_definition)$")
+    target_type: Literal[
+        "scope", "subnet", "host", "host_ports", "port",
+        "vulnerabilities", "vulnerability_definition",
+    ] | None = None
     target_id: UUID | None = None
 
 
 class TodoUpdate(BaseModel):
     title: str | None = Field(None, min_length=1, max_length=512)
     description: str | None = None
-    status: str | None = Field(None, pattern="^(open|done)$")
+    status: Literal["open", "done"] | None = None
     assigned_to_user_id: UUID | None = None
 
 
@@ -1,9 +1,13 @@
 """Audit logging for vulnerability and related actions."""
+import logging
+
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models.models import AuditEvent
 
+logger = logging.getLogger(__name__)
+
 
 def log_audit(
     db: Session,
@@ -31,3 +35,23 @@ def log_audit(
         user_agent=user_agent,
     )
     db.add(ev)
+
+
+def log_audit_background(**kwargs) -> None:
+    """Record an audit event from a background task, outside the request
+    transaction. Opens and commits its own session; accepts the same
+    keyword arguments as log_audit."""
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        log_audit(db, **kwargs)
+        db.commit()
+    except Exception:
+        # An audit row silently vanishing is worse than a noisy log line.
+        logger.exception(
+            "Dropped background audit event %s", kwargs.get("action_type")
+        )
+        db.rollback()
+    finally:
+        db.close()
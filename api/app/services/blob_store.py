@@ -0,0 +1,119 @@
+"""Content-addressed attachment storage shared by evidence and vuln attachments.
+
+Blobs live under attachments/blobs/<sha256[:2]>/<sha256><ext>, so identical
+files — the same screenshot pasted into several ports or definitions — are
+stored once and referenced by many rows. Deletion goes through blob_in_use
+so a shared file survives until its last referencing row is gone.
+"""
+import hashlib
+import os
+import threading
+import uuid as uuid_mod
+from functools import lru_cache
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.models import Evidence, VulnerabilityAttachment
+
+HASH_CHUNK = 1024 * 1024
+
+# Directories we have already created this process; saves the stat+mkdir
+# syscalls that os.makedirs(exist_ok=True) pays on every upload.
+_dir_ready: set[str] = set()
+_dir_ready_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def ext_for(name: str) -> str:
+    """Extension for an uploaded filename; bulk imports repeat the same
+    names, so cache the splitext work."""
+    return os.path.splitext(name)[1] or ""
+
+
+def ensure_dir(path: str) -> None:
+    if path in _dir_ready:
+        return
+    os.makedirs(path, exist_ok=True)
+    with _dir_ready_lock:
+        _dir_ready.add(path)
+
+
+def store_blob(fileobj, ext: str) -> tuple[str, int, str]:
+    """Stream an upload to content-addressed storage, hashing as we go.
+
+    Duplicates are detected by hash and the temp file is discarded.
+    Returns (stored_path, size, sha256).
+    """
+    blobs_dir = os.path.join(settings.attachments_dir, "blobs")
+    ensure_dir(blobs_dir)
+    tmp_path = os.path.join(blobs_dir, f".tmp-{uuid_mod.uuid4().hex}")
+    h = hashlib.sha256()
+    size = 0
+    with open(tmp_path, "wb") as f:
+        while chunk := fileobj.read(HASH_CHUNK):
+            h.update(chunk)
+            size += len(chunk)
+            f.write(chunk)
+    digest = h.hexdigest()
+    subdir = os.path.join(blobs_dir, digest[:2])
+    ensure_dir(subdir)
+    path = os.path.join(subdir, f"{digest}{ext}")
+    if os.path.exists(path):
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, path)
+    return path, size, digest
+
+
+def blob_in_use(
+    db: Session,
+    stored_path: str,
+    exclude_evidence_id=None,
+    exclude_attachment_id=None,
+) -> bool:
+    """True if any other row — evidence or vuln attachment — references the file."""
+    if not stored_path:
+        return False
+    ev_q = db.query(Evidence.id).filter(Evidence.stored_path == stored_path)
+    if exclude_evidence_id is not None:
+        ev_q = ev_q.filter(Evidence.id != exclude_evidence_id)
+    if ev_q.first() is not None:
+        return True
+    att_q = db.query(VulnerabilityAttachment.id).filter(
+        VulnerabilityAttachment.stored_path == stored_path
+    )
+    if exclude_attachment_id is not None:
+        att_q = att_q.filter(VulnerabilityAttachment.id != exclude_attachment_id)
+    return att_q.first() is not None
+
+
+def remove_blob_if_unused(
+    db: Session,
+    stored_path: str,
+    exclude_evidence_id=None,
+    exclude_attachment_id=None,
+) -> None:
+    """Delete the file behind a row being removed unless it is still shared."""
+    if not stored_path or not os.path.isfile(stored_path):
+        return
+    if not blob_in_use(
+        db,
+        stored_path,
+        exclude_evidence_id=exclude_evidence_id,
+        exclude_attachment_id=exclude_attachment_id,
+    ):
+        os.remove(stored_path)
+
+
+def remove_blob_if_unused_background(stored_path: str) -> None:
+    """Blob cleanup from a background task, after the referencing row's
+    deletion has committed. Opens and closes its own session; by this point
+    the row is gone, so no exclusions are needed."""
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        remove_blob_if_unused(db, stored_path)
+    finally:
+        db.close()
@@ -40,6 +40,11 @@ IMPORT_FORMAT_MASSCAN = "masscan"
 IMPORT_FORMAT_GOBUSTER = "gobuster"
 IMPORT_FORMAT_FFUF = "ffuf"
 
+# Case variants spelled out so the scan needs no per-name .lower() allocation;
+# endswith with a tuple is a single C-level multi-suffix match.
+_IMG_SUFFIXES = (".png", ".jpg", ".jpeg", ".PNG", ".JPG", ".JPEG")
+_JSONL_SUFFIXES = (".jsonl", ".JSONL")
+
 
 def _looks_like_whois_json(content: bytes) -> bool:
     """True if content is a JSON array of objects with 'ip' (whois/rdap format)."""
@@ -53,15 +58,84 @@ def _looks_like_whois_json(content: bytes) -> bool:
         return False
 
 
-def detect_import_format(content: bytes, filename: str) -> tuple[str | None, str]:
+_GOWITNESS_EXTRACT_SUFFIXES = _IMG_SUFFIXES + _JSONL_SUFFIXES
+
+
+def _detect_zip_format(zf: zipfile.ZipFile) -> tuple[str | None, str, str | None]:
+    """Classify an already-open ZIP: (format, error, nmap_member_name).
+
+    Operating on the open handle lets run_import validate and extract in
+    one central-directory parse instead of reopening the archive.
+    """
+    names = zf.namelist()
+
+    # One pass over the name list with an early exit; suffix tuples avoid
+    # allocating a lowercase copy of every name.
+    has_image = has_jsonl = False
+    for n in names:
+        if not has_image and n.endswith(_IMG_SUFFIXES):
+            has_image = True
+        if not has_jsonl and n.endswith(_JSONL_SUFFIXES):
+            has_jsonl = True
+        if has_image and has_jsonl:
+            break
+
+    for n in names:
+        if n.lower().endswith(".xml") and not n.startswith("__"):
+            try:
+                if detect_nmap_format(zf.read(n), n) == "xml":
+                    return IMPORT_FORMAT_NMAP, "", n
+            except Exception:
+                continue
+
+    if has_image or has_jsonl:
+        return IMPORT_FORMAT_GOWITNESS, "", None
+
+    return None, (
+        "ZIP contents not recognized. Expected: "
+        "Nmap XML (.xml), or GoWitness output (PNG/JPEG screenshots and/or .jsonl)."
+    ), None
+
+
+def _extract_gowitness_members(zf: zipfile.ZipFile, root: Path) -> None:
+    """Extract only gowitness-relevant members (images and .jsonl).
+
+    Skips macOS metadata and anything the parser would ignore, and guards
+    against Zip-Slip paths escaping the extraction root.
+    """
+    root_resolved = root.resolve()
+    members = []
+    for zi in zf.infolist():
+        name = zi.filename
+        if name.startswith("__MACOSX/") or not name.endswith(_GOWITNESS_EXTRACT_SUFFIXES):
+            continue
+        if not (root / name).resolve().is_relative_to(root_resolved):
+            continue
+        members.append(zi)
+    zf.extractall(root, members=members)
+
+
+def _open_zip(content: bytes | Path) -> zipfile.ZipFile:
+    """Open a ZIP from raw bytes or directly from a file path (no copy)."""
+    if isinstance(content, Path):
+        return zipfile.ZipFile(content, "r")
+    return zipfile.ZipFile(io.BytesIO(content), "r")
+
+
+def detect_import_format(content: bytes | Path, filename: str) -> tuple[str | None, str]:
     """
     Detect import format from file content and filename.
 
     Returns (format, error_message).
     - format: 'nmap' | 'gowitness' | 'text' | 'whois' | 'masscan' | None
     - error_message: empty if format detected, else human-readable error
+
+    content may be a Path for spooled uploads; ZIPs are then opened straight
+    from disk instead of being loaded into memory.
     """
     fn = (filename or "").lower().strip()
+    if isinstance(content, Path) and not fn.endswith(".zip"):
+        content = content.read_bytes()
 
     # Masscan list: explicit extensions or .txt that looks like masscan (open tcp port ip timestamp)
     if fn.endswith(".masscan") or fn.endswith(".lst"):
@@ -97,38 +171,11 @@ def detect_import_format(content: bytes, filename: str) -> tuple[str | None, str
 
     if fn.endswith(".zip"):
         try:
-            with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-                names = zf.namelist()
+            with _open_zip(content) as zf:
+                fmt, err, _ = _detect_zip_format(zf)
         except zipfile.BadZipFile:
             return None, "Invalid or corrupted ZIP file."
-
-        has_nmap_xml = False
-        nmap_xml_name = None
-        has_image = any(
-            n.lower().endswith(ext) for n in names for ext in (".png", ".jpg", ".jpeg")
-        )
-        has_jsonl = any(n.lower().endswith(".jsonl") for n in names)
-
-        for n in names:
-            if n.lower().endswith(".xml") and not n.startswith("__"):
-                try:
-                    with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-                        data = zf.read(n)
-                    if detect_nmap_format(data, n) == "xml":
-                        has_nmap_xml = True
-                        break
-                except Exception:
-                    continue
-
-        if has_nmap_xml:
-            return IMPORT_FORMAT_NMAP, ""
-        if has_image or has_jsonl:
-            return IMPORT_FORMAT_GOWITNESS, ""
-
-        return None, (
-            "ZIP contents not recognized. Expected: "
-            "Nmap XML (.xml), or GoWitness output (PNG/JPEG screenshots and/or .jsonl)."
-        )
+        return fmt, err
 
     if fn.endswith(".txt"):
         return IMPORT_FORMAT_TEXT, ""
@@ -147,7 +194,7 @@ def detect_import_format(content: bytes, filename: str) -> tuple[str | None, str
 def run_import(
     db: Session,
     project_id: UUID,
-    content: bytes,
+    content: bytes | Path,
     filename: str,
     user_id: UUID,
     request_ip: str | None = None,
@@ -156,23 +203,49 @@ def run_import(
     """
     Detect format and run the appropriate importer. Returns unified summary dict.
 
+    content may be a Path to a spooled upload; ZIP archives are then read
+    from disk without an in-memory copy.
+
     Raises ValueError with clear message if format unrecognized or import fails.
     """
-    fmt, err = detect_import_format(content, filename)
-    if not fmt:
-        raise ValueError(err or "Unsupported file format.")
+    if isinstance(content, Path) and not filename.lower().endswith(".zip"):
+        content = content.read_bytes()
+
+    if filename.lower().endswith(".zip"):
+        # Validate and consume the archive in one open (a single
+        # central-directory parse): nmap ZIPs yield their XML member's
+        # bytes, gowitness ZIPs are extracted under the same handle.
+        try:
+            with _open_zip(content) as zf:
+                fmt, err, nmap_member = _detect_zip_format(zf)
+                if fmt == IMPORT_FORMAT_GOWITNESS:
+                    import tempfile
+
+                    with tempfile.TemporaryDirectory(prefix="gowitness_") as tmpdir:
+                        root = Path(tmpdir)
+                        _extract_gowitness_members(zf, root)
+                        return _run_gowitness_from_root(
+                            db,
+                            project_id,
+                            root,
+                            user_id,
+                            request_ip,
+                            progress_callback=progress_callback,
+                        )
+                if fmt == IMPORT_FORMAT_NMAP:
+                    content = zf.read(nmap_member)
+                    filename = nmap_member
+        except zipfile.BadZipFile:
+            raise ValueError("Invalid or corrupted ZIP file.")
+        if not fmt:
+            raise ValueError(err or "Unsupported file format.")
+    else:
+        fmt, err = detect_import_format(content, filename)
+        if not fmt:
+            raise ValueError(err or "Unsupported file format.")
 
     if fmt == IMPORT_FORMAT_NMAP:
-        nmap_content = content
-        nmap_filename = filename
-        if filename.lower().endswith(".zip"):
-            with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-                for n in zf.namelist():
-                    if n.lower().endswith(".xml") and not n.startswith("__"):
-                        nmap_content = zf.read(n)
-                        nmap_filename = n
-                        break
-        parse_result = parse_nmap_xml(nmap_content, nmap_filename)
+        parse_result = parse_nmap_xml(content, filename)
         if parse_result.errors and not parse_result.hosts:
             raise ValueError(
                 parse_result.errors[0]
@@ -200,43 +273,6 @@ def run_import(
             "errors": summary.errors,
         }
 
-    if fmt == IMPORT_FORMAT_GOWITNESS:
-        import tempfile
-
-        with tempfile.TemporaryDirectory(prefix="gowitness_") as tmpdir:
-            root = Path(tmpdir)
-            with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-                zf.extractall(root)
-            parse_result = parse_gowitness_directory(root)
-            if not parse_result.records and parse_result.errors:
-                raise ValueError(
-                    parse_result.errors[0]
-                    if len(parse_result.errors) == 1
-                    else "; ".join(parse_result.errors[:3])
-                )
-            if not parse_result.records:
-                return {
-                    "format": "gowitness",
-                    "hosts_created": 0,
-                    "ports_created": 0,
-                    "screenshots_imported": 0,
-                    "metadata_records_imported": 0,
-                    "errors": parse_result.errors,
-                    "skipped": 0,
-                }
-            summary = _run_gowitness(
-                db, project_id, root, user_id, request_ip, progress_callback=progress_callback
-            )
-        return {
-            "format": "gowitness",
-            "hosts_created": summary.hosts_created,
-            "ports_created": summary.ports_created,
-            "screenshots_imported": summary.screenshots_imported,
-            "metadata_records_imported": summary.metadata_records_imported,
-            "errors": summary.errors,
-            "skipped": summary.skipped,
-        }
-
     if fmt == IMPORT_FORMAT_TEXT:
         summary = _run_text(db, project_id, content, filename, user_id, request_ip)
         return {
@@ -323,7 +359,7 @@ def run_gowitness_import_from_path(
         with tempfile.TemporaryDirectory(prefix="gowitness_") as tmpdir:
             root = Path(tmpdir)
             with zipfile.ZipFile(path, "r") as zf:
-                zf.extractall(root)
+                _extract_gowitness_members(zf, root)
             return _run_gowitness_from_root(
                 db, project_id, root, user_id, request_ip, progress_callback=progress_callback
             )
@@ -0,0 +1,90 @@
+"""
+Short-TTL cache of serialized list-endpoint responses.
+
+List reads are idempotent between writes, so the serialized JSON body is
+cached for a few seconds and handed back without touching the database.
+Uses Redis when available so all API workers share entries and
+invalidation, falling back to in-memory for single-process dev — same
+pattern as the import job store. Writers invalidate the enumerable key
+variants for the project they touched; the TTL bounds staleness for
+writes that bypass the API routes (e.g. bulk imports).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LIST_CACHE_TTL_SECONDS = 30
+
+_redis_client: "redis.Redis | None" = None
+_redis_available: bool | None = None
+_memory_store: dict[str, tuple[float, bytes]] = {}
+_memory_lock = threading.Lock()
+
+
+def _get_redis():
+    global _redis_client, _redis_available
+    if _redis_available is False:
+        return None
+    if _redis_client is not None:
+        return _redis_client
+    try:
+        import redis
+        _redis_client = redis.from_url(settings.redis_url)
+        _redis_client.ping()
+        _redis_available = True
+        return _redis_client
+    except Exception as e:
+        logger.warning("Redis unavailable for list cache, using in-memory fallback: %s", e)
+        _redis_available = False
+        return None
+
+
+def get_cached_list(key: str) -> bytes | None:
+    """Return the cached response body for key, or None on miss."""
+    r = _get_redis()
+    if r is not None:
+        try:
+            return r.get(key)
+        except Exception as e:
+            logger.warning("Redis get failed for list cache: %s", e)
+    with _memory_lock:
+        entry = _memory_store.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def store_list(key: str, payload: bytes) -> None:
+    """Cache the response body for LIST_CACHE_TTL_SECONDS."""
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.set(key, payload, ex=LIST_CACHE_TTL_SECONDS)
+            return
+        except Exception as e:
+            logger.warning("Redis set failed for list cache: %s", e)
+    with _memory_lock:
+        _memory_store[key] = (time.monotonic() + LIST_CACHE_TTL_SECONDS, payload)
+
+
+def invalidate_lists(keys: Iterable[str]) -> None:
+    """Drop the given cache keys after a write."""
+    keys = list(keys)
+    if not keys:
+        return
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis delete failed for list cache: %s", e)
+    with _memory_lock:
+        for key in keys:
+            _memory_store.pop(key, None)
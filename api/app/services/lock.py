@@ -2,7 +2,8 @@
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.core.config import settings
 from app.models.models import Lock, User
@@ -59,6 +60,14 @@ def acquire_lock(
         db.refresh(existing)
         return existing
 
+    # Clear any expired row for this record so the unique index on
+    # (record_type, record_id) accepts the new lock.
+    db.query(Lock).filter(
+        Lock.record_type == record_type,
+        Lock.record_id == record_id,
+        Lock.expires_at <= _now(),
+    ).delete(synchronize_session=False)
+
     lock = Lock(
         project_id=project_id,
         record_type=record_type,
@@ -67,7 +76,13 @@ def acquire_lock(
         expires_at=_expires_at(),
     )
     db.add(lock)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another user won the race between our check and the insert; the
+        # unique index is the arbiter.
+        db.rollback()
+        raise PermissionError("Record locked by another user")
     db.refresh(lock)
     return lock
 
@@ -116,10 +131,24 @@ def require_lock(
         raise PermissionError("Record is locked by another user")
 
 
+def purge_expired_locks(db: Session) -> int:
+    """Delete expired lock rows; returns the number removed.
+
+    Keeps the locks table (and its unique record index) at roughly the size
+    of the active lock set instead of growing with historical lock volume.
+    """
+    count = db.query(Lock).filter(Lock.expires_at <= _now()).delete(synchronize_session=False)
+    db.commit()
+    return count
+
+
 def list_locks_for_project(db: Session, project_id: UUID) -> list[Lock]:
     """List all active (non-expired) locks in a project."""
+    # The route serializes locked_by.username per lock; join it up front and
+    # have any other lazy load raise instead of becoming a hidden N+1.
     return (
         db.query(Lock)
+        .options(joinedload(Lock.locked_by), raiseload("*"))
         .filter(Lock.project_id == project_id, Lock.expires_at > _now())
         .all()
     )
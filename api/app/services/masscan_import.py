@@ -5,6 +5,12 @@ Masscan import: ingest Masscan list output and populate Hosts, Ports.
 - discovered_by=masscan, source_file, imported_at on all imported data
 - Never overwrite manual data; same-source (masscan) may update state
 - List format: status protocol port ip timestamp (last column = timestamp)
+
+Masscan sweeps produce by far the largest batches of any importer, so this
+path is written for bulk ingest: existing hosts/ports are prefetched in one
+query per table, new rows accumulate in the session and flush as a single
+executemany, and the whole import commits once at the end instead of
+round-tripping per row.
 """
 from __future__ import annotations
 
@@ -13,10 +19,10 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from app.models.models import Host, Port, Project
+from app.models.models import Host, Port, Project, Subnet
 from app.services.audit import log_audit
 from app.services.masscan_parser import MASSCAN_SOURCE, MasscanHost, MasscanParseResult
-from app.services.subnet import find_or_create_subnet_for_ip
+from app.services.subnet import cidr_for_ip
 
 
 class MasscanImportSummary:
@@ -38,93 +44,9 @@ class MasscanImportSummary:
         self.errors = errors or []
 
 
-def _find_or_create_host(
-    db: Session,
-    project_id: UUID,
-    mh: MasscanHost,
-    imported_at: datetime,
-) -> tuple[Host, bool]:
-    """Find or create host by project_id and IP. Returns (host, created)."""
-    ip = (mh.ip or "").strip()
-    if not ip:
-        raise ValueError("Masscan host has no IP")
-
-    existing = (
-        db.query(Host)
-        .filter(Host.project_id == project_id, Host.ip == ip)
-        .first()
-    )
-
-    if existing:
-        if existing.status in (None, "unknown"):
-            existing.status = "online"
-            db.commit()
-            db.refresh(existing)
-        return existing, False
-
-    subnet_id = find_or_create_subnet_for_ip(db, project_id, ip)
-    host = Host(
-        project_id=project_id,
-        subnet_id=subnet_id,
-        ip=ip,
-        dns_name=None,
-        status="online",
-    )
-    db.add(host)
-    db.commit()
-    db.refresh(host)
-    return host, True
-
-
-def _find_or_create_port(
-    db: Session,
-    host: Host,
-    port_id: int,
-    protocol: str,
-    state: str,
-    scanned_at: datetime | None = None,
-) -> tuple[Port, bool]:
-    """Find or create port. Returns (port, created)."""
+def _normalize_protocol(protocol: str) -> str:
     proto = (protocol or "tcp").lower()
-    if proto not in ("tcp", "udp"):
-        proto = "tcp"
-    state = (state or "open")[:32]
-
-    existing = (
-        db.query(Port)
-        .filter(Port.host_id == host.id, Port.protocol == proto, Port.number == port_id)
-        .first()
-    )
-
-    if existing:
-        is_same_source = (existing.discovered_by or "").lower() == MASSCAN_SOURCE
-        state_updated = False
-        if (not existing.state or is_same_source) and state:
-            existing.state = state
-            existing.discovered_by = MASSCAN_SOURCE
-            state_updated = True
-        if is_same_source and scanned_at is not None:
-            existing.scanned_at = scanned_at
-        if state_updated or (is_same_source and scanned_at is not None):
-            db.commit()
-            db.refresh(existing)
-        return existing, False
-
-    port = Port(
-        host_id=host.id,
-        protocol=proto,
-        number=port_id,
-        state=state,
-        service_name=None,
-        service_version=None,
-        banner=None,
-        discovered_by=MASSCAN_SOURCE,
-        scanned_at=scanned_at,
-    )
-    db.add(port)
-    db.commit()
-    db.refresh(port)
-    return port, True
+    return proto if proto in ("tcp", "udp") else "tcp"
 
 
 def run_masscan_import(
@@ -141,7 +63,6 @@ def run_masscan_import(
     """
     summary = MasscanImportSummary()
     source_file = parse_result.source_file or "masscan-import"
-    imported_at = datetime.now(timezone.utc)
 
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
@@ -166,53 +87,130 @@ def run_masscan_import(
     )
     db.commit()
 
+    # Prefetch the merge targets once; keyed by IP so rows created in this
+    # pass (which have no id until flush) share the same lookup structure.
+    hosts_by_ip: dict[str, Host] = {
+        h.ip: h for h in db.query(Host).filter(Host.project_id == project_id).all()
+    }
+    ip_by_host_id = {h.id: ip for ip, h in hosts_by_ip.items()}
+    subnet_id_by_cidr: dict[str, UUID] = {
+        s.cidr: s.id for s in db.query(Subnet).filter(Subnet.project_id == project_id).all()
+    }
+    ports_by_key: dict[tuple[str, str, int], Port] = {}
+    if ip_by_host_id:
+        for p in db.query(Port).filter(Port.host_id.in_(list(ip_by_host_id))).all():
+            ports_by_key[(ip_by_host_id[p.host_id], p.protocol, p.number)] = p
+
+    created_hosts: list[Host] = []
+    created_ports: list[Port] = []
+    created_ips: set[str] = set()
+
     for mh in parse_result.hosts:
         try:
-            host, host_created = _find_or_create_host(db, project_id, mh, imported_at)
-            if host_created:
-                summary.hosts_created += 1
-                log_audit(
-                    db,
+            ip = (mh.ip or "").strip()
+            if not ip:
+                raise ValueError("Masscan host has no IP")
+
+            host = hosts_by_ip.get(ip)
+            if host is not None:
+                if host.status in (None, "unknown"):
+                    host.status = "online"
+                if ip not in created_ips:
+                    summary.hosts_updated += 1
+            else:
+                subnet_id = None
+                cidr = cidr_for_ip(ip)
+                if cidr:
+                    subnet_id = subnet_id_by_cidr.get(cidr)
+                    if subnet_id is None:
+                        # flush (not commit) assigns the id while keeping the
+                        # whole import in one transaction.
+                        subnet = Subnet(project_id=project_id, cidr=cidr, name=None)
+                        db.add(subnet)
+                        db.flush()
+                        subnet_id = subnet.id
+                        subnet_id_by_cidr[cidr] = subnet_id
+                host = Host(
                     project_id=project_id,
-                    user_id=user_id,
-                    action_type="masscan_host_created",
-                    record_type="host",
-                    record_id=host.id,
-                    after_json={"ip": host.ip},
-                    ip_address=request_ip,
+                    subnet_id=subnet_id,
+                    ip=ip,
+                    dns_name=None,
+                    status="online",
                 )
-            else:
-                summary.hosts_updated += 1
+                db.add(host)
+                hosts_by_ip[ip] = host
+                created_hosts.append(host)
+                created_ips.add(ip)
+                summary.hosts_created += 1
 
             for mp in mh.ports:
                 try:
+                    proto = _normalize_protocol(mp.protocol)
+                    state = (mp.state or "open")[:32]
                     scanned_at = (
                         datetime.fromtimestamp(mp.timestamp, tz=timezone.utc)
                         if mp.timestamp is not None
                         else None
                     )
-                    port, port_created = _find_or_create_port(
-                        db, host, mp.port_id, mp.protocol, mp.state, scanned_at=scanned_at
-                    )
-                    if port_created:
-                        summary.ports_created += 1
-                        log_audit(
-                            db,
-                            project_id=project_id,
-                            user_id=user_id,
-                            action_type="masscan_port_created",
-                            record_type="port",
-                            record_id=port.id,
-                            after_json={"number": port.number, "protocol": port.protocol},
-                            ip_address=request_ip,
-                        )
-                    else:
+                    existing = ports_by_key.get((ip, proto, mp.port_id))
+                    if existing is not None:
+                        is_same_source = (
+                            existing.discovered_by or ""
+                        ).lower() == MASSCAN_SOURCE
+                        if (not existing.state or is_same_source) and state:
+                            existing.state = state
+                            existing.discovered_by = MASSCAN_SOURCE
+                        if is_same_source and scanned_at is not None:
+                            existing.scanned_at = scanned_at
                         summary.ports_updated += 1
+                        continue
+                    port = Port(
+                        host=host,
+                        protocol=proto,
+                        number=mp.port_id,
+                        state=state,
+                        service_name=None,
+                        service_version=None,
+                        banner=None,
+                        discovered_by=MASSCAN_SOURCE,
+                        scanned_at=scanned_at,
+                    )
+                    db.add(port)
+                    ports_by_key[(ip, proto, mp.port_id)] = port
+                    created_ports.append(port)
+                    summary.ports_created += 1
                 except Exception as e:
                     summary.errors.append(f"Port {mp.port_id}/{mp.protocol}: {e}")
         except Exception as e:
             summary.errors.append(f"Host {mh.ip}: {e}")
 
+    # One flush assigns ids to everything created above (batched INSERTs),
+    # so the per-record audit rows can reference them before the commit.
+    db.flush()
+
+    for host in created_hosts:
+        log_audit(
+            db,
+            project_id=project_id,
+            user_id=user_id,
+            action_type="masscan_host_created",
+            record_type="host",
+            record_id=host.id,
+            after_json={"ip": host.ip},
+            ip_address=request_ip,
+        )
+    for port in created_ports:
+        log_audit(
+            db,
+            project_id=project_id,
+            user_id=user_id,
+            action_type="masscan_port_created",
+            record_type="port",
+            record_id=port.id,
+            after_json={"number": port.number, "protocol": port.protocol},
+            ip_address=request_ip,
+        )
+
     log_audit(
         db,
         project_id=project_id,
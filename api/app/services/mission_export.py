@@ -47,6 +47,10 @@ def _row_to_dict(row, exclude=None):
     for c in row.__table__.columns:
         if c.name in exclude:
             continue
+        if c.computed is not None:
+            # Generated columns (e.g. search_tsv) are derived server-side and
+            # cannot be inserted on import.
+            continue
         v = getattr(row, c.name)
         d[c.name] = _serialize_value(v)
     return d
@@ -103,8 +103,7 @@ def _find_or_create_host(
             existing.status = "unresolved"
             need_update = True
         if need_update:
-            db.commit()
-            db.refresh(existing)
+            db.flush()
         return existing, False
 
     subnet_id = find_or_create_subnet_for_ip(db, project_id, ip) if not is_unresolved and ip != UNRESOLVED_IP else None
@@ -118,8 +117,7 @@ def _find_or_create_host(
         status=status,
     )
     db.add(host)
-    db.commit()
-    db.refresh(host)
+    db.flush()
     return host, True
 
 
@@ -239,7 +237,7 @@ def _add_evidence(
         source_file=source_file,
     )
     db.add(ev)
-    db.commit()
+    db.flush()
     return True
 
 
@@ -294,8 +292,7 @@ def _find_or_create_port(
             existing.scanned_at = scanned_at
             need_commit = True
         if need_commit:
-            db.commit()
-            db.refresh(existing)
+            db.flush()
             summary.ports_updated += 1
         return existing, False
 
@@ -313,8 +310,7 @@ def _find_or_create_port(
         scanned_at=scanned_at,
     )
     db.add(port)
-    db.commit()
-    db.refresh(port)
+    db.flush()
     return port, True
 
 
@@ -462,6 +458,7 @@ def run_nmap_import(
                 )
             else:
                 summary.hosts_updated += 1
+            db.commit()
 
             meta = parse_result.import_metadata
             for nh_port in nh.ports:
@@ -493,10 +490,16 @@ def run_nmap_import(
                     _add_port_evidence(
                         db, project_id, host.id, port, nh_port, source_file, imported_at, summary
                     )
+                    # One commit per port: the inner helpers only flush, so a
+                    # port and all its evidence rows go out as batched INSERTs
+                    # instead of a commit (round-trip + fsync) per row.
+                    db.commit()
                 except Exception as e:
                     summary.errors.append(f"Port {nh_port.port_id}/{nh_port.protocol}: {e}")
+                    db.rollback()
         except Exception as e:
             summary.errors.append(f"Host {nh.ip or nh.hostname}: {e}")
+            db.rollback()
 
     meta = parse_result.import_metadata
     completed_json = {
@@ -571,22 +571,25 @@ def _builder_columns_json() -> dict[str, list[list[str]]]:
     return {k: [list(pair) for pair in v] for k, v in BUILDER_COLUMNS.items()}
 
 
-def _run_builder(
+def _iter_builder(
     db: Session,
     project_id: UUID,
     data_source: str,
     columns: list[str],
     filter_expression: str,
-) -> list[dict]:
-    """Run builder report: select columns, apply filter expression."""
+):
+    """Yield builder report rows: select columns, apply filter expression.
+
+    A generator so callers can stream rows without materializing the whole
+    result; the queries iterate in batches via yield_per.
+    """
     pf = parse_filter(filter_expression) if filter_expression else None
     valid_cols = {c[0] for c in BUILDER_COLUMNS.get(data_source, [])}
     cols = [c for c in columns if c in valid_cols] or list(valid_cols)
 
     if data_source == "hosts":
         q = db.query(Host, Subnet).outerjoin(Subnet, Host.subnet_id == Subnet.id).filter(Host.project_id == project_id)
-        rows = []
-        for h, s in q.all():
+        for h, s in q.yield_per(500):
             if pf and not entity_matches_filter(pf, "host", h, subnet_cidr=s.cidr if s else None):
                 continue
             row = {}
@@ -615,8 +618,8 @@ def _run_builder(
                 row["whois_registry"] = w.get("asn_registry")
             row["_target_type"] = "host"
             row["_target_id"] = str(h.id)
-            rows.append(row)
-        return rows
+            yield row
+        return
 
     if data_source == "ports":
         q = (
@@ -625,8 +628,7 @@ def _run_builder(
             .outerjoin(Subnet, Host.subnet_id == Subnet.id)
             .filter(Host.project_id == project_id)
         )
-        rows = []
-        for p, h, s in q.all():
+        for p, h, s in q.yield_per(500):
             if pf and not entity_matches_filter(pf, "port", p, host=h, port=p, subnet_cidr=s.cidr if s else None):
                 continue
             row = {}
@@ -644,8 +646,8 @@ def _run_builder(
                 row["state"] = p.state
             row["_target_type"] = "port"
             row["_target_id"] = str(p.id)
-            rows.append(row)
-        return rows
+            yield row
+        return
 
     if data_source == "evidence":
         q = (
@@ -654,8 +656,7 @@ def _run_builder(
             .outerjoin(Subnet, Host.subnet_id == Subnet.id)
             .filter(Evidence.project_id == project_id)
         )
-        rows = []
-        for ev, h, s in q.all():
+        for ev, h, s in q.yield_per(500):
             if pf:
                 if not entity_matches_filter(pf, "evidence", ev, host=h, subnet_cidr=s.cidr if s else None):
                     continue
@@ -676,8 +677,8 @@ def _run_builder(
                 row["source_timestamp"] = ev.source_timestamp
             row["_target_type"] = "port_evidence"
             row["_target_id"] = str(ev.id)
-            rows.append(row)
-        return rows
+            yield row
+        return
 
     if data_source == "vulns":
         q = (
@@ -687,8 +688,7 @@ def _run_builder(
             .outerjoin(Subnet, Host.subnet_id == Subnet.id)
             .filter(VulnerabilityInstance.project_id == project_id)
         )
-        rows = []
-        for vi, vd, h, s in q.all():
+        for vi, vd, h, s in q.yield_per(500):
             if pf and not entity_matches_filter(pf, "vuln", vi, host=h, vd=vd, vi=vi, subnet_cidr=s.cidr if s else None):
                 continue
             row = {}
@@ -704,10 +704,7 @@ def _run_builder(
                 row["status"] = vi.status
             row["_target_type"] = "vuln_definition"
             row["_target_id"] = str(vd.id)
-            rows.append(row)
-        return rows
-
-    return []
+            yield row
 
 
 REPORT_REGISTRY: dict[str, tuple[ReportConfig, callable]] = {
@@ -758,6 +755,19 @@ def list_report_configs() -> list[ReportConfig]:
     return [cfg for cfg, _ in REPORT_REGISTRY.values()]
 
 
+def iter_builder_rows(
+    db: Session,
+    project_id: UUID,
+    data_source: str,
+    columns: list[str],
+    filter_expression: str,
+):
+    """Yield builder report rows one at a time (for streaming responses)."""
+    if data_source not in BUILDER_COLUMNS:
+        raise ValueError(f"Invalid data_source: {data_source}")
+    return _iter_builder(db, project_id, data_source, columns, filter_expression)
+
+
 def run_builder(
     db: Session,
     project_id: UUID,
@@ -766,6 +776,4 @@ def run_builder(
     filter_expression: str,
 ) -> list[dict]:
     """Run builder report."""
-    if data_source not in BUILDER_COLUMNS:
-        raise ValueError(f"Invalid data_source: {data_source}")
-    return _run_builder(db, project_id, data_source, columns, filter_expression)
+    return list(iter_builder_rows(db, project_id, data_source, columns, filter_expression))
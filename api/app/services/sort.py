@@ -1,11 +1,38 @@
 """Sort helpers for subnets, hosts, and ports (project sort_mode support)."""
-from sqlalchemy.orm import Query
+import time
+from typing import Literal, get_args
+from uuid import UUID
 
-from app.models.models import Subnet, Host, Port
+from sqlalchemy.orm import Query, Session
 
-SORT_MODES = ("cidr_asc", "cidr_desc", "alpha_asc", "alpha_desc", "last_seen_desc")
+from app.models.models import Project, Subnet, Host, Port
+
+# Annotate query params with SortMode so pydantic-core validates them and
+# invalid values get a 422 instead of a silent fallback.
+SortMode = Literal["cidr_asc", "cidr_desc", "alpha_asc", "alpha_desc", "last_seen_desc"]
+SORT_MODES = get_args(SortMode)
 DEFAULT_SORT = "cidr_asc"
 
+# sort_mode changes rarely but is read on every tree listing; cache it per
+# project for a short TTL. Writers call invalidate_project_sort_mode.
+_SORT_MODE_TTL_SECONDS = 30.0
+_sort_mode_cache: dict[UUID, tuple[float, str | None]] = {}
+
+
+def get_project_sort_mode(db: Session, project_id: UUID) -> str | None:
+    """Return the project's sort_mode (or None), cached for a short TTL."""
+    now = time.monotonic()
+    entry = _sort_mode_cache.get(project_id)
+    if entry is not None and now - entry[0] < _SORT_MODE_TTL_SECONDS:
+        return entry[1]
+    mode = db.query(Project.sort_mode).filter(Project.id == project_id).scalar()
+    _sort_mode_cache[project_id] = (now, mode)
+    return mode
+
+
+def invalidate_project_sort_mode(project_id: UUID) -> None:
+    _sort_mode_cache.pop(project_id, None)
+
 
 def apply_subnet_order(q: Query, mode: str) -> Query:
     """Apply sort_mode to a Subnet query."""
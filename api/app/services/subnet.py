@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from app.models.models import Subnet
 
 
-def _cidr_for_ip(ip_str: str) -> str | None:
+def cidr_for_ip(ip_str: str) -> str | None:
     """Derive a /24 (IPv4) or /64 (IPv6) CIDR that contains the given IP. Returns None for invalid or unresolved."""
     ip_str = (ip_str or "").strip().lower()
     if not ip_str or ip_str == "unresolved":
@@ -33,7 +33,7 @@ def find_or_create_subnet_for_ip(db: Session, project_id: UUID, ip: str) -> UUID
     - IPv6: uses /64
     - Returns None for "unresolved" or invalid IPs
     """
-    cidr = _cidr_for_ip(ip)
+    cidr = cidr_for_ip(ip)
     if not cidr:
         return None
 
@@ -0,0 +1,129 @@
+"""
+Short-TTL cache of user rows for get_current_user.
+
+Every authenticated request loads the user to confirm it still exists and is
+not disabled; caching the row for a few seconds removes that round trip on
+hot paths. Uses Redis when available so all API workers share entries (and
+invalidation), falling back to in-memory for single-process dev — same
+pattern as the import job store. Writers call invalidate_user.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.models import User
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_TTL_SECONDS = 30
+
+_redis_client: "redis.Redis | None" = None
+_redis_available: bool | None = None
+_memory_store: dict[str, tuple[float, str]] = {}
+_memory_lock = threading.Lock()
+
+
+def _get_redis():
+    global _redis_client, _redis_available
+    if _redis_available is False:
+        return None
+    if _redis_client is not None:
+        return _redis_client
+    try:
+        import redis
+        _redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+        _redis_client.ping()
+        _redis_available = True
+        return _redis_client
+    except Exception as e:
+        logger.warning("Redis unavailable for user cache, using in-memory fallback: %s", e)
+        _redis_available = False
+        return None
+
+
+def _key(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+def _serialize(user: User) -> str:
+    role = user.role.value if hasattr(user.role, "value") else str(user.role)
+    return json.dumps({
+        "id": str(user.id),
+        "username": user.username,
+        "password_hash": user.password_hash,
+        "role": role,
+        "must_change_password": user.must_change_password,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "disabled_at": user.disabled_at.isoformat() if user.disabled_at else None,
+    })
+
+
+def user_from_cached(raw: str) -> User:
+    """Rebuild a User instance from a cached row.
+
+    The caller is expected to attach it to a session with
+    db.merge(user, load=False) so writes through it still persist. The
+    instance is marked detached first: merge(load=False) rejects transient
+    objects, and a freshly constructed User has no identity key yet.
+    """
+    data = json.loads(raw)
+    user = User(
+        id=UUID(data["id"]),
+        username=data["username"],
+        password_hash=data["password_hash"],
+        role=data["role"],
+        must_change_password=data["must_change_password"],
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        disabled_at=datetime.fromisoformat(data["disabled_at"]) if data["disabled_at"] else None,
+    )
+    make_transient_to_detached(user)
+    return user
+
+
+def get_cached_user(user_id: UUID) -> str | None:
+    """Return the serialized cached row for user_id, or None on miss."""
+    r = _get_redis()
+    if r is not None:
+        try:
+            return r.get(_key(user_id))
+        except Exception as e:
+            logger.warning("Redis get failed for user cache: %s", e)
+    with _memory_lock:
+        entry = _memory_store.get(str(user_id))
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def store_user(user: User) -> None:
+    """Cache the user row for USER_CACHE_TTL_SECONDS."""
+    raw = _serialize(user)
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.set(_key(user.id), raw, ex=USER_CACHE_TTL_SECONDS)
+            return
+        except Exception as e:
+            logger.warning("Redis set failed for user cache: %s", e)
+    with _memory_lock:
+        _memory_store[str(user.id)] = (time.monotonic() + USER_CACHE_TTL_SECONDS, raw)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop the cached row after a user mutation (role, password, disable)."""
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.delete(_key(user_id))
+        except Exception as e:
+            logger.warning("Redis delete failed for user cache: %s", e)
+    with _memory_lock:
+        _memory_store.pop(str(user_id), None)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import socket
 from contextlib import asynccontextmanager
@@ -5,6 +6,7 @@ from uuid import UUID
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.ws import manager as ws_manager
@@ -13,20 +15,78 @@ from app.db.base import Base
 from app.api.routes import router as api_router
 
 
+def _purge_expired_locks_once() -> None:
+    from app.db.session import SessionLocal
+    from app.services.lock import purge_expired_locks
+
+    db = SessionLocal()
+    try:
+        purge_expired_locks(db)
+    finally:
+        db.close()
+
+
+async def _lock_cleanup_loop() -> None:
+    # Expired lock rows are dead weight in the unique record index; sweep
+    # them out once per TTL. Errors (e.g. transient DB outage) are ignored
+    # and the next tick retries.
+    while True:
+        await asyncio.sleep(settings.lock_ttl_seconds)
+        try:
+            await asyncio.to_thread(_purge_expired_locks_once)
+        except Exception:
+            pass
+
+
+def _ensure_audit_partitions_once() -> None:
+    from sqlalchemy import text
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT ensure_audit_events_partitions()"))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _audit_partition_loop() -> None:
+    # Keep monthly audit_events partitions created ahead of time so rows
+    # land in their month partition instead of piling up in the DEFAULT
+    # one. Runs at startup and then daily; the function is a no-op when
+    # the partitions already exist.
+    while True:
+        try:
+            await asyncio.to_thread(_ensure_audit_partitions_once)
+        except Exception:
+            pass
+        await asyncio.sleep(86400)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    from app.db.session import SessionLocal
+    from app.db.session import SessionLocal, warm_pool
     from app.db.seed import seed_admin
     db = SessionLocal()
     try:
         seed_admin(db)
     finally:
         db.close()
+    warm_pool()
+    cleanup_task = asyncio.create_task(_lock_cleanup_loop())
+    partition_task = asyncio.create_task(_audit_partition_loop())
     yield
+    partition_task.cancel()
+    cleanup_task.cancel()
     engine.dispose()
 
 
-app = FastAPI(title="RedOpSync API", version="1.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="RedOpSync API",
+    version="1.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -52,3 +52,36 @@ def test_projects_require_auth():
     tc = TestClient(app)
     r = tc.get("/api/projects")
     assert r.status_code == 401
+
+
+def test_me_served_from_user_cache():
+    """Two back-to-back authenticated requests resolve the user from the
+    short-TTL cache — the merge(load=False) attach path in
+    get_current_user — without touching the database."""
+    from uuid import uuid4
+    from datetime import datetime, timezone
+
+    from app.core.security import TOKEN_COOKIE_NAME, create_access_token
+    from app.models.models import User
+    from app.services.user_cache import invalidate_user, store_user
+
+    user = User(
+        id=uuid4(),
+        username="cache-probe",
+        password_hash="x",
+        role="admin",
+        must_change_password=False,
+        created_at=datetime.now(timezone.utc),
+        disabled_at=None,
+    )
+    store_user(user)
+    tc = TestClient(app)
+    tc.cookies.set(TOKEN_COOKIE_NAME, create_access_token(user.id, user.username, "admin"))
+    try:
+        r1 = tc.get("/api/auth/me")
+        r2 = tc.get("/api/auth/me")
+    finally:
+        invalidate_user(user.id)
+    assert r1.status_code == 200, r1.text
+    assert r2.status_code == 200, r2.text
+    assert r2.json()["username"] == "cache-probe"
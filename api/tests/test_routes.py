@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.routing import APIRoute
+
+from main import app
+
+
+def _iter_route_keys(routes):
+    """Yield (method, full path) for every APIRoute registration.
+
+    include_router wraps included routers (fastapi >= 0.141); their
+    effective_route_contexts() expands each inclusion with its full
+    prefixed path, so double registrations stay visible here while the
+    OpenAPI paths dict would collapse them by key.
+    """
+    for route in routes:
+        if isinstance(route, APIRoute):
+            for method in route.methods or ():
+                yield (method, route.path)
+            continue
+        contexts = getattr(route, "effective_route_contexts", None)
+        if callable(contexts):
+            for ctx in contexts():
+                if isinstance(ctx.original_route, APIRoute):
+                    for method in ctx.original_route.methods or ():
+                        yield (method, ctx.path)
+
+
+def test_no_duplicate_route_registrations():
+    """A module accidentally imported or declared twice would register its
+    routes twice; FastAPI resolves to the first match, silently shadowing
+    the rest."""
+    seen = set()
+    for key in _iter_route_keys(app.routes):
+        assert key not in seen, f"duplicate route: {key[0]} {key[1]}"
+        seen.add(key)
+    # Sanity: the walker actually saw the API, not just the bare app routes.
+    assert any(path.startswith("/api/") for _, path in seen)